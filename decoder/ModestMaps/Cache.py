@@ -0,0 +1,291 @@
+"""
+>>> from tempfile import mkdtemp
+>>> c = TileCache(mkdtemp(), max_bytes=1024, ttl=60)
+>>> key = ('tile.openstreetmap.org', '/7/13/10.png', '')
+>>> c.get(key) is None
+True
+>>> c.put(key, b'hello')
+>>> c.get(key)
+b'hello'
+>>> c.put(key, b'expired', ttl=-1)
+>>> c.get(key) is None
+True
+
+>>> c.put(key, b'stale', ttl=-1, headers={'ETag': '"abc"'})
+>>> c.get(key) is None
+True
+>>> body, meta = c.lookup(key)
+>>> body, meta['headers']
+(b'stale', {'ETag': '"abc"'})
+
+>>> c.put(key, b'', ttl=60, status=404)
+>>> c.get(key) is None
+True
+>>> body, meta = c.lookup(key)
+>>> body, meta['status']
+(b'', 404)
+
+>>> freshness({'Cache-Control': 'public, max-age=3600', 'Age': '600'})
+3000
+>>> freshness({'Cache-Control': 'no-cache'})
+0
+>>> freshness({}) is None
+True
+"""
+
+import os
+import json
+import time
+import email.utils
+import fcntl
+import hashlib
+import tempfile
+import threading
+
+# response headers kept with each tile, for revalidation
+VALIDATORS = 'ETag', 'Last-Modified', 'Cache-Control'
+
+# defaults for the shared cache, overridable through the environment
+DEFAULT_DIRECTORY = os.path.join(tempfile.gettempdir(), 'modestmaps-tiles')
+DEFAULT_BYTES = 512 * 1024 * 1024
+DEFAULT_TTL = 24 * 60 * 60
+
+# seconds to remember tiles that aren't there, and tiles that kept failing
+MISSING_TTL = 60 * 60
+FAILED_TTL = 60
+
+# status of an entry for a tile that kept failing
+FAILED = 0
+
+class TileCache:
+    """ Size-bounded store of encoded tile bodies in a directory on disk.
+
+        Entries are keyed by (netloc, path, query) tuples and written with an
+        atomic rename, so any number of processes can share one directory.
+        Every read bumps an entry's modification time, which eviction uses
+        as its least-recently-used clock. Expired entries with an ETag or
+        Last-Modified header are kept around so they can be revalidated.
+
+        Entries with a status other than 200 are negative: empty bodies
+        remembering that a tile is missing or failing.
+    """
+
+    # how often to look at the whole directory, regardless of local writes
+    SWEEP_INTERVAL = 60
+
+    def __init__(self, directory, max_bytes=DEFAULT_BYTES, ttl=DEFAULT_TTL):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+
+        # lock file for sweeps, whose modification time is when the last one began
+        self.lockname = os.path.join(directory, '.lock')
+
+        os.makedirs(directory, exist_ok=True)
+
+        # bytes written by this process since the last sweep
+        self.written = 0
+        self.swept = self.lastSweep()
+        self.lock = threading.Lock()
+
+    def lastSweep(self):
+        """ Return when any process last swept the directory, or 0 if none has.
+        """
+        try:
+            return os.stat(self.lockname).st_mtime
+        except OSError:
+            return 0
+
+    def path(self, key):
+        """ Return the file path for a (netloc, path, query) key.
+        """
+        digest = hashlib.sha1(repr(tuple(key)).encode('utf8')).hexdigest()
+        return os.path.join(self.directory, digest[:2], digest)
+
+    def lookup(self, key):
+        """ Return the cached body and metadata for a key, fresh or not.
+
+            Metadata is a dictionary with an expires timestamp, any saved
+            response headers and a status for negative entries. Returns
+            (None, None) when missing.
+        """
+        filename = self.path(key)
+
+        try:
+            with open(filename, 'rb') as file:
+                meta = json.loads(file.readline())
+                body = file.read()
+        except (OSError, ValueError):
+            return None, None
+
+        try:
+            # freshen the entry for the LRU
+            os.utime(filename)
+        except OSError:
+            pass
+
+        return body, meta
+
+    def get(self, key):
+        """ Return the cached body for a key, or None if missing, negative or expired.
+        """
+        body, meta = self.lookup(key)
+
+        if body is None or meta.get('status', 200) != 200:
+            return None
+
+        if meta['expires'] < time.time():
+            if not validators(meta.get('headers', {})):
+                # no way to revalidate this one, so let it go
+                try:
+                    os.unlink(self.path(key))
+                except OSError:
+                    pass
+            return None
+
+        return body
+
+    def put(self, key, body, ttl=None, headers=None, status=200):
+        """ Store a body under a key, for ttl seconds or the cache default.
+
+            Any ETag, Last-Modified and Cache-Control headers are kept.
+            A status other than 200 makes a negative entry.
+        """
+        filename = self.path(key)
+        meta = dict(expires=time.time() + (self.ttl if ttl is None else ttl))
+        headers = headers or {}
+        meta.update(headers=dict([(name, headers[name]) for name in VALIDATORS if name in headers]))
+
+        if status != 200:
+            meta.update(status=status)
+
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        handle, tmpname = tempfile.mkstemp(dir=os.path.dirname(filename), prefix='.tmp-')
+
+        try:
+            with os.fdopen(handle, 'wb') as file:
+                file.write(json.dumps(meta).encode('utf8') + b'\n')
+                file.write(body)
+            os.replace(tmpname, filename)
+        except:
+            os.unlink(tmpname)
+            raise
+
+        with self.lock:
+            self.written += len(body)
+            due = self.written > self.max_bytes / 10 or time.time() > self.swept + TileCache.SWEEP_INTERVAL
+
+        if due and self.written <= self.max_bytes / 10:
+            # another process may have swept since this one last looked
+            self.swept = max(self.swept, self.lastSweep())
+            due = time.time() > self.swept + TileCache.SWEEP_INTERVAL
+
+        if due:
+            self.evict()
+
+    def evict(self):
+        """ Delete least-recently-used entries until the cache fits its budget.
+
+            Holds an exclusive lock on the directory so concurrent
+            processes don't sweep at the same time.
+        """
+        with self.lock:
+            self.written, self.swept = 0, time.time()
+
+        with open(self.lockname, 'w') as lockfile:
+            fcntl.flock(lockfile, fcntl.LOCK_EX)
+            os.utime(lockfile.fileno())
+
+            entries, total = [], 0
+
+            for subdir in os.scandir(self.directory):
+                if not subdir.is_dir():
+                    continue
+                for entry in os.scandir(subdir.path):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+
+            if total <= self.max_bytes:
+                return
+
+            # go a bit under budget so we don't sweep on every write
+            target = self.max_bytes * 9 / 10
+
+            for (mtime, size, filename) in sorted(entries):
+                if total <= target:
+                    break
+                try:
+                    os.unlink(filename)
+                except OSError:
+                    continue
+                total -= size
+
+def validators(headers):
+    """ Return request headers for a conditional GET based on saved response headers.
+    """
+    conditions = {}
+
+    if 'ETag' in headers:
+        conditions['If-None-Match'] = headers['ETag']
+
+    if 'Last-Modified' in headers:
+        conditions['If-Modified-Since'] = headers['Last-Modified']
+
+    return conditions
+
+def freshness(headers):
+    """ Return the freshness lifetime in seconds given by response headers, or None.
+    """
+    for directive in headers.get('Cache-Control', '').split(','):
+        name, _, value = directive.strip().partition('=')
+
+        if name.lower() in ('no-cache', 'no-store'):
+            return 0
+
+        if name.lower() == 'max-age':
+            try:
+                return max(0, int(value.strip('"')) - int(headers.get('Age', 0)))
+            except ValueError:
+                pass
+
+    if 'Expires' in headers:
+        try:
+            expires = email.utils.parsedate_to_datetime(headers['Expires']).timestamp()
+        except (TypeError, ValueError):
+            return 0
+        else:
+            return max(0, int(expires - time.time()))
+
+    return None
+
+_default_cache, _default_cache_lock = None, threading.Lock()
+
+def defaultCache():
+    """ Return a process-wide TileCache configured from the environment.
+
+        TILE_CACHE_DIR sets the directory and may be empty to disable
+        caching, TILE_CACHE_BYTES sets the size budget and TILE_CACHE_TTL
+        sets the lifetime of entries in seconds.
+    """
+    global _default_cache
+
+    with _default_cache_lock:
+        if _default_cache is None:
+            directory = os.environ.get('TILE_CACHE_DIR', DEFAULT_DIRECTORY)
+
+            if directory:
+                max_bytes = int(os.environ.get('TILE_CACHE_BYTES', DEFAULT_BYTES))
+                ttl = float(os.environ.get('TILE_CACHE_TTL', DEFAULT_TTL))
+                _default_cache = TileCache(directory, max_bytes, ttl)
+            else:
+                _default_cache = False
+
+    return _default_cache or None
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,119 @@
+""" Mosaic tile images into a map with NumPy.
+
+>>> from PIL import Image
+>>> canvas = newCanvas(4, 2)
+>>> paste(canvas, Image.new('RGB', (2, 2), (0, 0, 0)), -1, 0)
+>>> paste(canvas, Image.new('RGBA', (2, 2), (255, 0, 0, 128)), 3, 0)
+>>> canvas[0].tolist()
+[[0, 0, 0], [255, 255, 255], [255, 255, 255], [255, 127, 127]]
+
+>>> try:
+...     verifyTile(b'<html>')
+... except IOError:
+...     print('not a tile')
+not a tile
+"""
+
+import sys
+from io import BytesIO
+
+import numpy
+
+try:
+    import Image
+except ImportError:
+    import PIL.Image as Image
+
+def newCanvas(width, height):
+    """ Return a white height x width x 3 array of bytes to paste tiles into.
+    """
+    return numpy.full((height, width, 3), 255, dtype=numpy.uint8)
+
+def paste(canvas, img, x, y):
+    """ Paste an RGB or RGBA image into a canvas with its top-left at x, y.
+
+        RGB images are copied straight in, RGBA images are alpha-blended
+        over whatever is already there. Anything outside the canvas is cut.
+    """
+    height, width = canvas.shape[:2]
+
+    left, top = max(x, 0), max(y, 0)
+    right, bottom = min(x + img.size[0], width), min(y + img.size[1], height)
+
+    if left >= right or top >= bottom:
+        return
+
+    pixels = numpy.asarray(img)[top - y:bottom - y, left - x:right - x]
+
+    if img.mode == 'RGB':
+        canvas[top:bottom, left:right] = pixels
+        return
+
+    alpha = pixels[:, :, 3:4].astype(numpy.uint16)
+    under = canvas[top:bottom, left:right].astype(numpy.uint16)
+    over = pixels[:, :, 0:3].astype(numpy.uint16)
+
+    canvas[top:bottom, left:right] = (over * alpha + under * (255 - alpha) + 127) // 255
+
+def composite(tiles, width, height):
+    """ Paste the images of a list of loaded tiles into a new RGB PIL.Image.
+
+        Layers of each tile are drawn in order, base first. Layers given
+        as encoded bytes are decoded one at a time as they're pasted, so
+        only one decoded tile is ever held in memory. A layer that won't
+        decode is left out, like a missing one, and a layer bigger than
+        its provider's tiles is scaled down to fit.
+    """
+    canvas = newCanvas(width, height)
+
+    for tile in tiles:
+        if not tile.loaded():
+            continue
+
+        for layer in tile.images():
+            if layer is None:
+                continue
+
+            try:
+                img = decodeTile(BytesIO(layer)) if isinstance(layer, bytes) else layer
+            except Exception as e:
+                print('Skipping undecodable tile layer at', tile.coord, '-', e, file=sys.stderr)
+                continue
+
+            size = tile.provider.tileWidth(), tile.provider.tileHeight()
+
+            if img.size != size:
+                img = img.resize(size, Image.LANCZOS)
+
+            paste(canvas, img, tile.offset.x, tile.offset.y)
+
+    return Image.fromarray(canvas, 'RGB')
+
+def verifyTile(body):
+    """ Raise an IOError unless bytes look like an image that will decode.
+
+        Checks the image header and structure without decoding the pixels.
+    """
+    try:
+        Image.open(BytesIO(body)).verify()
+    except Exception as e:
+        raise IOError('Not a tile image: %s' % e)
+
+def decodeTile(source):
+    """ Decode a tile file to an RGB image if it's opaque, or RGBA if not.
+
+        Opaque tiles, usually base layers, can then skip alpha blending.
+    """
+    img = Image.open(source)
+
+    if img.mode in ('RGBA', 'LA', 'PA') or 'transparency' in img.info:
+        img = img.convert(mode='RGBA')
+
+        if img.getchannel('A').getextrema() != (255, 255):
+            return img
+
+    return img.convert(mode='RGB')
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -28,40 +28,40 @@
 (1.000, 1.000 @2.000)
 >>> c.left()
 (0.000, 0.000 @2.000)
+>>> c == Coordinate(0, 1, 2), len(set([c, c.copy(), c.up().down()]))
+(True, 1)
+
+>>> rows, columns = zoomArrays([0, 1], [1, 2], 2, 3)
+>>> rows.tolist(), columns.tolist()
+([0.0, 2.0], [2.0, 4.0])
 """
 
 import math
+from collections import namedtuple
+
+import numpy
+
+class Point(namedtuple('Point', ('x', 'y'))):
+    """ Immutable x, y pair, hashed and compared by value.
+    """
+    __slots__ = ()
 
-class Point:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-    
     def __repr__(self):
-        return '(%(x).3f, %(y).3f)' % self.__dict__
+        return '(%.3f, %.3f)' % (self.x, self.y)
     
-class Coordinate:
+class Coordinate(namedtuple('Coordinate', ('row', 'column', 'zoom'))):
+    """ Immutable tile grid position, hashed and compared by value.
+    """
+    __slots__ = ()
+
     MAX_ZOOM = 25
 
-    def __init__(self, row, column, zoom):
-        self.row = row
-        self.column = column
-        self.zoom = zoom
-    
     def __repr__(self):
-        return '(%(row).3f, %(column).3f @%(zoom).3f)' % self.__dict__
-        
-    def __eq__(self, other):
-        return self.zoom == other.zoom and self.row == other.row and self.column == other.column
-        
-    def __cmp__(self, other):
-        return cmp((self.zoom, self.row, self.column), (other.zoom, other.row, other.column))
-
-    def __hash__(self):
-        return hash(('Coordinate', self.row, self.column, self.zoom))
+        return '(%.3f, %.3f @%.3f)' % (self.row, self.column, self.zoom)
         
     def copy(self):
-        return self.__class__(self.row, self.column, self.zoom)
+        # nothing to copy, since coordinates can't change
+        return self
         
     def container(self):
         return self.__class__(math.floor(self.row), math.floor(self.column), self.zoom)
@@ -88,6 +88,14 @@ class Coordinate:
     def left(self, distance=1):
         return self.__class__(self.row, self.column - distance, self.zoom)
 
+def zoomArrays(rows, columns, zoom, destination):
+    """ Like Coordinate.zoomTo(), for NumPy arrays of rows and columns.
+
+        Zooms may be arrays too, to broadcast against rows and columns.
+    """
+    scale = numpy.power(2., numpy.asarray(destination, dtype=float) - zoom)
+    return numpy.asarray(rows, dtype=float) * scale, numpy.asarray(columns, dtype=float) * scale
+
 if __name__ == '__main__':
     import doctest
     doctest.testmod()
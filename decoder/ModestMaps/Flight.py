@@ -0,0 +1,54 @@
+"""
+>>> flight = SingleFlight()
+>>> flight.do('key', lambda: 'value')
+'value'
+>>> flight.calls
+{}
+"""
+
+import threading
+from concurrent.futures import Future
+
+class SingleFlight:
+    """ Coalesces concurrent calls with the same key into one.
+
+        The first caller for a key runs the function, and anyone else
+        asking for that key while it runs waits for and shares its result,
+        or its exception. Nothing is remembered once the call is done.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = {}
+
+    def do(self, key, fn, *args):
+        """ Return fn(*args), or the result of an identical call already in flight.
+        """
+        with self.lock:
+            leader = key not in self.calls
+
+            if leader:
+                self.calls[key] = Future()
+
+            future = self.calls[key]
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn(*args)
+
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+
+        else:
+            future.set_result(result)
+            return result
+
+        finally:
+            with self.lock:
+                del self.calls[key]
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -41,18 +41,32 @@
 (0.696, -2.129 @10.000)
 >>> m.coordinateLocation(Coordinate(0.696, -2.129, 10.000))
 (37.001, -121.983)
+
+>>> rows, columns = m.locationCoordinateArrays([37, 10], [-122, 10])
+>>> rows.round(3).tolist(), columns.round(3).tolist()
+([0.696, 0.175], [-2.129, 0.175])
+>>> lats, lons = m.coordinateLocationArrays(rows, columns, 10)
+>>> lats.round(3).tolist(), lons.round(3).tolist()
+([37.0, 10.0], [-122.0, 10.0])
+>>> rows, columns = m.locationCoordinateArrays([37], [-122], 11)
+>>> rows.round(3).tolist(), columns.round(3).tolist()
+([1.392], [-4.259])
 """
 
 import math
-from .Core import Point, Coordinate
+from collections import namedtuple
+
+import numpy
+
+from .Core import Point, Coordinate, zoomArrays
+
+class Location(namedtuple('Location', ('lat', 'lon'))):
+    """ Immutable latitude, longitude pair, hashed and compared by value.
+    """
+    __slots__ = ()
 
-class Location:
-    def __init__(self, lat, lon):
-        self.lat = lat
-        self.lon = lon
-        
     def __repr__(self):
-        return '(%(lat).3f, %(lon).3f)' % self.__dict__
+        return '(%.3f, %.3f)' % (self.lat, self.lon)
 
 class Transformation:
     def __init__(self, ax, bx, cx, ay, by, cy):
@@ -71,6 +85,18 @@ class Transformation:
         return Point((point.x*self.by - point.y*self.bx - self.cx*self.by + self.cy*self.bx) / (self.ax*self.by - self.ay*self.bx),
                      (point.x*self.ay - point.y*self.ax - self.cx*self.ay + self.cy*self.ax) / (self.bx*self.ay - self.by*self.ax))
 
+    def transformArrays(self, xs, ys):
+        """ Like transform(), for NumPy arrays of x and y values.
+        """
+        return (self.ax*xs + self.bx*ys + self.cx,
+                self.ay*xs + self.by*ys + self.cy)
+
+    def untransformArrays(self, xs, ys):
+        """ Like untransform(), for NumPy arrays of x and y values.
+        """
+        return ((xs*self.by - ys*self.bx - self.cx*self.by + self.cy*self.bx) / (self.ax*self.by - self.ay*self.bx),
+                (xs*self.ay - ys*self.ax - self.cx*self.ay + self.cy*self.ax) / (self.bx*self.ay - self.by*self.ax))
+
 def deriveTransformation(a1x, a1y, a2x, a2y, b1x, b1y, b2x, b2y, c1x, c1y, c2x, c2y):
     """ Generates a transform based on three pairs of points, a1 -> a2, b1 -> b2, c1 -> c2.
     """
@@ -115,6 +141,12 @@ class IProjection:
     def rawUnproject(self, point):
         raise NotImplementedError("Abstract method not implemented by subclass.")
 
+    def rawProjectArrays(self, xs, ys):
+        raise NotImplementedError("Abstract method not implemented by subclass.")
+
+    def rawUnprojectArrays(self, xs, ys):
+        raise NotImplementedError("Abstract method not implemented by subclass.")
+
     def project(self, point):
         point = self.rawProject(point)
         if(self.transformation):
@@ -138,6 +170,42 @@ class IProjection:
         point = self.unproject(point)
         return Location(180.0 * point.y / math.pi, 180.0 * point.x / math.pi)
 
+    def projectArrays(self, xs, ys):
+        xs, ys = self.rawProjectArrays(xs, ys)
+        if(self.transformation):
+            xs, ys = self.transformation.transformArrays(xs, ys)
+        return xs, ys
+
+    def unprojectArrays(self, xs, ys):
+        if(self.transformation):
+            xs, ys = self.transformation.untransformArrays(xs, ys)
+        xs, ys = self.rawUnprojectArrays(xs, ys)
+        return xs, ys
+
+    def locationCoordinateArrays(self, lats, lons, zoom=None):
+        """ Like locationCoordinate(), for NumPy arrays of latitudes and longitudes.
+
+            Returns arrays of rows and columns, at an optional zoom
+            or the projection's own.
+        """
+        xs = math.pi * numpy.asarray(lons, dtype=float) / 180.0
+        ys = math.pi * numpy.asarray(lats, dtype=float) / 180.0
+        xs, ys = self.projectArrays(xs, ys)
+
+        if zoom is None:
+            return ys, xs
+
+        return zoomArrays(ys, xs, self.zoom, zoom)
+
+    def coordinateLocationArrays(self, rows, columns, zoom):
+        """ Like coordinateLocation(), for NumPy arrays of rows and columns at a zoom.
+
+            Returns arrays of latitudes and longitudes.
+        """
+        rows, columns = zoomArrays(rows, columns, zoom, self.zoom)
+        xs, ys = self.unprojectArrays(columns, rows)
+        return 180.0 * ys / math.pi, 180.0 * xs / math.pi
+
 class LinearProjection(IProjection):
     def rawProject(self, point):
         return Point(point.x, point.y)
@@ -145,6 +213,12 @@ class LinearProjection(IProjection):
     def rawUnproject(self, point):
         return Point(point.x, point.y)
 
+    def rawProjectArrays(self, xs, ys):
+        return xs, ys
+
+    def rawUnprojectArrays(self, xs, ys):
+        return xs, ys
+
 class MercatorProjection(IProjection):
     def rawProject(self, point):
         return Point(point.x,
@@ -154,6 +228,12 @@ class MercatorProjection(IProjection):
         return Point(point.x,
                      2 * math.atan(math.pow(math.e, point.y)) - 0.5 * math.pi)
 
+    def rawProjectArrays(self, xs, ys):
+        return xs, numpy.log(numpy.tan(0.25 * math.pi + 0.5 * ys))
+
+    def rawUnprojectArrays(self, xs, ys):
+        return xs, 2 * numpy.arctan(numpy.exp(ys)) - 0.5 * math.pi
+
 if __name__ == '__main__':
     import doctest
     doctest.testmod()
@@ -0,0 +1,124 @@
+""" Keep-alive HTTP client shared by every tile request in a process.
+
+    Connections are pooled per host and reused across tiles and across
+    calls to Map.draw(), so a page pays for each TCP and TLS handshake
+    once instead of once per tile. Requests to each host are held to
+    an adaptive limit shared with other processes, see Throttle.py.
+    Slow requests can be hedged with a second one, see hedgedGet().
+"""
+
+import os
+import time
+import threading
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .Throttle import defaultLimiter, NoFreeSlot
+
+USER_AGENT = 'Field Papers (http://fieldpapers.org/)'
+
+# most connections to keep open to any one tile host
+POOL_SIZE = int(os.environ.get('TILE_POOL_SIZE', 8))
+
+# most tile hosts to keep pools for
+POOL_HOSTS = 16
+
+# seconds to wait for a connection and then for a response
+TIMEOUT = (10, 30)
+
+# most hedged requests in flight at once
+HEDGE_WORKERS = 64
+
+_session, _session_lock = None, threading.Lock()
+_hedging, _hedging_lock = None, threading.Lock()
+
+def session():
+    """ Return the process-wide requests.Session used for tiles.
+
+        Requests beyond POOL_SIZE to a single host wait for a free
+        connection instead of opening new ones. With a host limiter, the
+        pool is at least as big as the limiter's maximum, so a request
+        holding a slot never queues for a connection and has the wait
+        counted as the host's latency.
+    """
+    global _session
+
+    with _session_lock:
+        if _session is None:
+            limiter = defaultLimiter()
+            maxsize = max(POOL_SIZE, limiter.maximum) if limiter else POOL_SIZE
+            adapter = HTTPAdapter(pool_connections=POOL_HOSTS, pool_maxsize=maxsize, pool_block=True)
+
+            _session = requests.Session()
+            _session.headers['User-Agent'] = USER_AGENT
+            _session.mount('http://', adapter)
+            _session.mount('https://', adapter)
+
+    return _session
+
+def get(url, headers=None):
+    """ GET a URL over a pooled connection and return a requests.Response.
+
+        Waits for a slot under the host's concurrency limit first, and
+        raises NoFreeSlot if none comes free within TIMEOUT[0].
+    """
+    limiter = defaultLimiter()
+
+    if limiter is None:
+        return session().get(url, headers=headers, timeout=TIMEOUT)
+
+    host = urllib.parse.urlparse(url).netloc
+    slot = limiter.acquire(host, TIMEOUT[0])
+
+    if slot is None:
+        raise NoFreeSlot('No free slot for %s' % host)
+
+    start, ok = time.time(), False
+
+    try:
+        response = session().get(url, headers=headers, timeout=TIMEOUT)
+
+        # throttling and server errors mean back off, anything else is fine
+        ok = response.status_code != 429 and response.status_code < 500
+
+        return response
+
+    finally:
+        limiter.release(slot, time.time() - start, ok)
+
+def hedgedGet(url, alternate, delay, headers=None, spare=None):
+    """ GET a URL, and an alternate URL too if there's no response within delay seconds.
+
+        Returns whichever requests.Response arrives first, and flags for
+        whether the alternate was requested and whether it won. The
+        slower request is left to finish in the background, and its URL
+        and response passed to the optional spare function if it succeeds. Requests run in
+        their own threads, so tile workers can wait on them safely.
+    """
+    global _hedging
+
+    with _hedging_lock:
+        if _hedging is None:
+            _hedging = ThreadPoolExecutor(max_workers=HEDGE_WORKERS, thread_name_prefix='ModestMaps-hedge')
+
+    first = _hedging.submit(get, url, headers)
+
+    if wait([first], timeout=delay).done:
+        return first.result(), False, False
+
+    second = _hedging.submit(get, alternate, headers)
+    done, pending = wait([first, second], return_when=FIRST_COMPLETED)
+    winner = first if first in done else second
+
+    if winner.exception() is not None:
+        # fall back on the other one, which raises too if it also fails
+        winner = second if winner is first else first
+
+    if spare is not None:
+        loser, other = (second, alternate) if winner is first else (first, url)
+        loser.add_done_callback(lambda future: future.exception() is None and spare(other, future.result()))
+
+    return winner.result(), True, winner is second
@@ -0,0 +1,73 @@
+"""
+>>> p = Provider('/data/basemap.mbtiles')
+>>> p.getTileUrls(Coordinate(25322, 10507, 16))
+('mbtiles:///data/basemap.mbtiles?z=16&x=10507&y=25322',)
+"""
+
+from math import pi
+
+import sqlite3
+import threading
+import urllib.parse
+
+from .Core import Coordinate
+from .Geo import MercatorProjection, deriveTransformation
+from .Providers import IMapProvider
+
+class Provider(IMapProvider):
+    """ Raster tiles from a local MBTiles (SQLite) archive, tile_size pixels square.
+    """
+    def __init__(self, path, tile_size=256):
+        # the spherical mercator world tile covers (-π, -π) to (π, π)
+        t = deriveTransformation(-pi, pi, 0, 0, pi, pi, 1, 0, -pi, -pi, 0, 1)
+        self.projection = MercatorProjection(0, t)
+        self.path = path
+        self.tile_size = tile_size
+
+    def tileWidth(self):
+        return self.tile_size
+
+    def tileHeight(self):
+        return self.tile_size
+
+    def getTileUrls(self, coordinate):
+        return ('mbtiles://%s?z=%d&x=%d&y=%d' % (self.path, coordinate.zoom, coordinate.column, coordinate.row),)
+
+class Archive:
+    """ Read-only MBTiles file, with one SQLite connection per thread.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.local = threading.local()
+
+    def connection(self):
+        if not hasattr(self.local, 'db'):
+            self.local.db = sqlite3.connect('file:%s?mode=ro' % urllib.parse.quote(self.path), uri=True)
+
+        return self.local.db
+
+    def read(self, zoom, column, row):
+        """ Return the bytes of a tile, or None if the archive doesn't have it.
+        """
+        # MBTiles rows count up from the bottom, TMS-style
+        tms_row = (1 << zoom) - 1 - row
+
+        result = self.connection().execute('SELECT tile_data FROM tiles WHERE zoom_level = ? AND tile_column = ? AND tile_row = ?',
+                                           (zoom, column, tms_row)).fetchone()
+
+        return result and bytes(result[0])
+
+_archives, _archives_lock = {}, threading.Lock()
+
+def openArchive(path):
+    """ Return a shared Archive for a path.
+    """
+    with _archives_lock:
+        if path not in _archives:
+            _archives[path] = Archive(path)
+
+        return _archives[path]
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
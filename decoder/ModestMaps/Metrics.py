@@ -0,0 +1,121 @@
+"""
+>>> m = TileMetrics()
+>>> m.count('tile.openstreetmap.org', 'requests')
+>>> m.count('tile.openstreetmap.org', 'bytes', 1000)
+>>> for seconds in (.1, .2, .3, .4): m.latency('tile.openstreetmap.org', seconds)
+>>> r = m.report()['hosts']['tile.openstreetmap.org']
+>>> r['requests'], r['bytes'], r['latency']['p50'], r['latency']['max']
+(1, 1000, 0.2, 0.4)
+"""
+
+import os
+import sys
+import json
+import math
+import threading
+from collections import deque
+
+class TileMetrics:
+    """ Counts and latencies of tile loads for one map, by provider host.
+
+        Counters are requests (made over the network), hits and misses
+        (of the memory and disk caches), revalidated (stale cached tiles
+        confirmed by a 304), bytes (received), retries, not_found (404
+        and 410 responses), rejected (requests not made because the
+        host is down), hedged (second requests sent for slow tiles) and
+        hedge_wins (second requests that answered first).
+    """
+    COUNTERS = ('requests', 'hits', 'misses', 'revalidated', 'bytes', 'retries', 'not_found', 'rejected',
+                'hedged', 'hedge_wins')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.hosts = {}
+        self.latencies = {}
+
+        # seconds spent waiting on the map deadline, and tiles it cut off
+        self.waited = 0
+        self.unfinished = 0
+
+    def count(self, host, name, amount=1):
+        """ Add to one of the counters for a host.
+        """
+        with self.lock:
+            if host not in self.hosts:
+                self.hosts[host] = dict([(counter, 0) for counter in TileMetrics.COUNTERS])
+
+            self.hosts[host][name] += amount
+
+    def latency(self, host, seconds):
+        """ Note how long one network request to a host took.
+        """
+        with self.lock:
+            self.latencies.setdefault(host, []).append(seconds)
+
+    def report(self):
+        """ Return a JSON-friendly dictionary of everything counted so far.
+        """
+        with self.lock:
+            hosts = dict([(host, dict(counts)) for (host, counts) in self.hosts.items()])
+
+            for (host, latencies) in self.latencies.items():
+                latencies = sorted(latencies)
+
+                hosts.setdefault(host, dict([(counter, 0) for counter in TileMetrics.COUNTERS]))
+                hosts[host]['latency'] = dict(p50=percentile(latencies, 50), p90=percentile(latencies, 90),
+                                              p95=percentile(latencies, 95), p99=percentile(latencies, 99),
+                                              max=round(latencies[-1], 4))
+
+            return dict(hosts=hosts, waited=round(self.waited, 3), unfinished=self.unfinished)
+
+class LatencyWindow:
+    """ Latencies of the most recent requests to each host, across every map in a process.
+    """
+    def __init__(self, size=200, minimum=20):
+        self.size = size
+        self.minimum = minimum
+
+        self.lock = threading.Lock()
+        self.hosts = {}
+
+    def add(self, host, seconds):
+        with self.lock:
+            if host not in self.hosts:
+                self.hosts[host] = deque(maxlen=self.size)
+
+            self.hosts[host].append(seconds)
+
+    def percentile(self, host, pct):
+        """ Return a percentile of recent latencies for a host, or None without enough of them.
+        """
+        with self.lock:
+            latencies = sorted(self.hosts.get(host, []))
+
+        if len(latencies) < self.minimum:
+            return None
+
+        return percentile(latencies, pct)
+
+def percentile(values, pct):
+    """ Nearest-rank percentile of a sorted list.
+    """
+    return round(values[max(0, int(math.ceil(pct / 100. * len(values))) - 1)], 4)
+
+def emitMetrics(report):
+    """ Write a metrics report out as a single line of JSON.
+
+        Appends to the file named by TILE_METRICS_PATH if it's set, so a
+        task runner can collect reports, otherwise writes to stderr.
+    """
+    line = json.dumps(report, sort_keys=True)
+    path = os.environ.get('TILE_METRICS_PATH')
+
+    if path:
+        with open(path, 'a') as file:
+            file.write(line + '\n')
+    else:
+        print('tile-metrics', line, file=sys.stderr)
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,202 @@
+"""
+>>> p = Provider('/data/basemap.pmtiles')
+>>> p.getTileUrls(Coordinate(25322, 10507, 16))
+('pmtiles:///data/basemap.pmtiles?z=16&x=10507&y=25322',)
+
+>>> [zxyToTileId(1, x, y) for (x, y) in ((0, 0), (0, 1), (1, 1), (1, 0))]
+[1, 2, 3, 4]
+>>> zxyToTileId(2, 3, 3)
+15
+
+>>> buf = bytes([3, 1, 1, 2, 2, 0, 1, 5, 5, 5, 1, 0, 0])
+>>> parseDirectory(buf)
+([1, 2, 4], [2, 0, 1], [5, 5, 5], [0, 5, 10])
+"""
+
+from math import pi
+
+import gzip
+import mmap
+import struct
+import threading
+from bisect import bisect_right
+
+from .Core import Coordinate
+from .Geo import MercatorProjection, deriveTransformation
+from .Providers import IMapProvider
+
+# https://github.com/protomaps/PMTiles/blob/main/spec/v3/spec.md
+HEADER = struct.Struct('<7sB11Q6B')
+
+COMPRESSION_UNKNOWN, COMPRESSION_NONE, COMPRESSION_GZIP = 0, 1, 2
+
+class Provider(IMapProvider):
+    """ Raster tiles from a local PMTiles (v3) archive, tile_size pixels square.
+    """
+    def __init__(self, path, tile_size=256):
+        # the spherical mercator world tile covers (-π, -π) to (π, π)
+        t = deriveTransformation(-pi, pi, 0, 0, pi, pi, 1, 0, -pi, -pi, 0, 1)
+        self.projection = MercatorProjection(0, t)
+        self.path = path
+        self.tile_size = tile_size
+
+    def tileWidth(self):
+        return self.tile_size
+
+    def tileHeight(self):
+        return self.tile_size
+
+    def getTileUrls(self, coordinate):
+        return ('pmtiles://%s?z=%d&x=%d&y=%d' % (self.path, coordinate.zoom, coordinate.column, coordinate.row),)
+
+def zxyToTileId(zoom, column, row):
+    """ Return the PMTiles tile ID, a position along a Hilbert curve at each zoom.
+    """
+    n = 1 << zoom
+    tile_id = (n * n - 1) // 3
+
+    s = n >> 1
+
+    while s > 0:
+        rx = 1 if column & s else 0
+        ry = 1 if row & s else 0
+        tile_id += s * s * ((3 * rx) ^ ry)
+
+        # rotate the quadrant
+        if ry == 0:
+            if rx == 1:
+                column, row = n - 1 - column, n - 1 - row
+            column, row = row, column
+
+        s >>= 1
+
+    return tile_id
+
+def readVarint(buf, pos):
+    """ Return an unsigned LEB128 integer from a buffer and the position after it.
+    """
+    value, shift = 0, 0
+
+    while True:
+        byte = buf[pos]
+        pos += 1
+        value |= (byte & 0x7f) << shift
+
+        if byte & 0x80 == 0:
+            return value, pos
+
+        shift += 7
+
+def parseDirectory(buf):
+    """ Return lists of tile IDs, run lengths, lengths and offsets from a directory.
+    """
+    count, pos = readVarint(buf, 0)
+    tile_ids, run_lengths, lengths, offsets = [], [], [], []
+
+    last_id = 0
+
+    for i in range(count):
+        delta, pos = readVarint(buf, pos)
+        last_id += delta
+        tile_ids.append(last_id)
+
+    for i in range(count):
+        run_length, pos = readVarint(buf, pos)
+        run_lengths.append(run_length)
+
+    for i in range(count):
+        length, pos = readVarint(buf, pos)
+        lengths.append(length)
+
+    for i in range(count):
+        offset, pos = readVarint(buf, pos)
+
+        if offset == 0 and i > 0:
+            # directly follows the previous entry
+            offsets.append(offsets[i - 1] + lengths[i - 1])
+        else:
+            offsets.append(offset - 1)
+
+    return tile_ids, run_lengths, lengths, offsets
+
+def decompress(data, compression):
+    if compression in (COMPRESSION_UNKNOWN, COMPRESSION_NONE):
+        return bytes(data)
+
+    if compression == COMPRESSION_GZIP:
+        return gzip.decompress(data)
+
+    raise IOError('Unsupported PMTiles compression: %d' % compression)
+
+class Archive:
+    """ Read-only PMTiles file, memory-mapped and shared by all threads.
+    """
+    # how deep leaf directories may nest
+    MAX_DEPTH = 4
+
+    def __init__(self, path):
+        with open(path, 'rb') as file:
+            self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        header = HEADER.unpack_from(self.data, 0)
+
+        if header[0] != b'PMTiles' or header[1] != 3:
+            raise IOError('Not a PMTiles v3 archive: %s' % path)
+
+        (self.root_offset, self.root_length, metadata_offset, metadata_length,
+         self.leaves_offset, leaves_length, self.tiles_offset) = header[2:9]
+
+        self.internal_compression, self.tile_compression = header[14], header[15]
+
+        # parsed directories by offset, which are small and read over and over
+        self.directories = {}
+        self.lock = threading.Lock()
+
+    def directory(self, offset, length):
+        with self.lock:
+            if offset not in self.directories:
+                buf = decompress(self.data[offset:offset + length], self.internal_compression)
+                self.directories[offset] = parseDirectory(buf)
+
+            return self.directories[offset]
+
+    def read(self, zoom, column, row):
+        """ Return the bytes of a tile, or None if the archive doesn't have it.
+        """
+        tile_id = zxyToTileId(zoom, column, row)
+        offset, length = self.root_offset, self.root_length
+
+        for depth in range(Archive.MAX_DEPTH):
+            tile_ids, run_lengths, lengths, offsets = self.directory(offset, length)
+            i = bisect_right(tile_ids, tile_id) - 1
+
+            if i < 0:
+                return None
+
+            if run_lengths[i] == 0:
+                # a leaf directory covering this tile
+                offset, length = self.leaves_offset + offsets[i], lengths[i]
+                continue
+
+            if tile_id - tile_ids[i] >= run_lengths[i]:
+                return None
+
+            start = self.tiles_offset + offsets[i]
+            return decompress(self.data[start:start + lengths[i]], self.tile_compression)
+
+        return None
+
+_archives, _archives_lock = {}, threading.Lock()
+
+def openArchive(path):
+    """ Return a shared Archive for a path.
+    """
+    with _archives_lock:
+        if path not in _archives:
+            _archives[path] = Archive(path)
+
+        return _archives[path]
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
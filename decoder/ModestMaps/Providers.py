@@ -1,4 +1,21 @@
-﻿import re
+﻿"""
+>>> p = TemplatedMercatorProvider('http://{S}.tile.example.com/{Z}/{X}/{Y}.png', 'abc')
+>>> p.getTileUrls(Coordinate(1, 0, 1)), p.getTileUrls(Coordinate(1, 1, 1))
+(['http://b.tile.example.com/1/0/1.png'], ['http://c.tile.example.com/1/1/1.png'])
+>>> p.getAlternateUrl('http://c.tile.example.com/1/1/1.png')
+'http://a.tile.example.com/1/1/1.png'
+>>> TemplatedMercatorProvider('http://{S}.tile.example.com/{Z}/{X}/{Y}.png').getTileUrls(Coordinate(1, 1, 1))
+['http://a.tile.example.com/1/1/1.png']
+
+>>> TemplatedMercatorProvider('http://tile.example.com/{Z}/{X}/{Y}@2x.png', tile_size=512).tileWidth()
+512
+>>> p = TemplatedMercatorProvider('http://tile.example.com/{Z}/{X}/{Y}@2x.png,http://labels.example.com/{Z}/{X}/{Y}.png', tile_size='512,256')
+>>> p.tile_sizes, p.tileWidth()
+([512, 256], 256)
+"""
+
+import os
+import re
 from math import pi, pow
 
 from .Core import Coordinate
@@ -22,12 +39,23 @@ class IMapProvider:
     def tileHeight(self):
         raise NotImplementedError("Abstract method not implemented by subclass.")
     
+    def getAlternateUrl(self, url):
+        """ Return an equivalent URL for a tile, ideally from another host, to hedge a slow request.
+        """
+        return url
+
     def locationCoordinate(self, location):
         return self.projection.locationCoordinate(location)
 
     def coordinateLocation(self, location):
         return self.projection.coordinateLocation(location)
 
+    def locationCoordinateArrays(self, lats, lons, zoom=None):
+        return self.projection.locationCoordinateArrays(lats, lons, zoom)
+
+    def coordinateLocationArrays(self, rows, columns, zoom):
+        return self.projection.coordinateLocationArrays(rows, columns, zoom)
+
     def sourceCoordinate(self, coordinate):
         wrappedColumn = coordinate.column % pow(2, coordinate.zoom)
         
@@ -36,33 +64,77 @@ class IMapProvider:
             
         return Coordinate(coordinate.row, wrappedColumn, coordinate.zoom)
 
+# subdomains for {S} in tile templates; just one unless a provider or the environment lists more
+SUBDOMAINS = os.environ.get('TILE_SUBDOMAINS', 'a').split(',')
+
+# pixel size of templated tiles, 256 or 512, overridable through the environment
+TILE_SIZE = os.environ.get('TILE_SIZE') or 256
+
 class TemplatedMercatorProvider(IMapProvider):
     """ Convert URI templates into tile URLs, using a tileUrlTemplate identical to:
         http://code.google.com/apis/maps/documentation/overlays.html#Custom_Map_Types
+
+        An {S} in a template is replaced by one of a list of subdomains,
+        picked by tile so that neighboring tiles go to different hosts
+        and any one tile always goes to the same host.
+
+        Tiles are tile_size pixels square, 256 or 512. A tile_size can also
+        be a comma-separated list with one size for each template, and the
+        last size goes for any templates past the end of it. Maps are laid
+        out in the smallest of them, and bigger tiles are scaled down to
+        fit, so high-resolution base layers can mix with plain overlays.
     """
-    def __init__(self, template):
+    def __init__(self, template, subdomains=None, tile_size=None):
         # the spherical mercator world tile covers (-π, -π) to (π, π)
         t = deriveTransformation(-pi, pi, 0, 0, pi, pi, 1, 0, -pi, -pi, 0, 1)
         self.projection = MercatorProjection(0, t)
         
         self.templates = []
+        self.subdomains = list(subdomains or SUBDOMAINS)
         
         while template:
-            match = re.match(r'^((http|https|file)://\S+?)(,(http|https|file)://\S+)?$', template)
+            match = re.match(r'^((http|https|file|mbtiles|pmtiles)://\S+?)(,(http|https|file|mbtiles|pmtiles)://\S+)?$', template)
             first = match.group(1)
             
             if match:
-                self.templates.append(first)
+                if match.group(2) in ('mbtiles', 'pmtiles') and '{Z}' not in first:
+                    # a bare archive path, e.g. mbtiles:///data/basemap.mbtiles
+                    self.templates.append(first + '?z={Z}&x={X}&y={Y}')
+                else:
+                    self.templates.append(first.replace('{s}', '{S}'))
                 template = template[len(first):].lstrip(',')
             else:
                 break
 
+        sizes = [int(size) for size in str(tile_size or TILE_SIZE).split(',')]
+        self.tile_sizes = [sizes[min(index, len(sizes) - 1)] for index in range(len(self.templates))]
+        self.tile_size = min(self.tile_sizes or sizes)
+
+        # patterns to find the subdomain of a tile URL, for getAlternateUrl()
+        shard = '(?P<S>%s)' % '|'.join(map(re.escape, self.subdomains))
+        self.patterns = [re.compile('^' + re.escape(t).replace(re.escape('{S}'), shard, 1).replace(re.escape('{S}'), '(?P=S)')
+                                    .replace(re.escape('{X}'), r'\d+').replace(re.escape('{Y}'), r'\d+').replace(re.escape('{Z}'), r'\d+') + '$')
+                         for t in self.templates if '{S}' in t]
+
     def tileWidth(self):
-        return 256
+        return self.tile_size
 
     def tileHeight(self):
-        return 256
+        return self.tile_size
 
     def getTileUrls(self, coordinate):
         x, y, z = str(int(coordinate.column)), str(int(coordinate.row)), str(int(coordinate.zoom))
-        return [t.replace('{X}', x).replace('{Y}', y).replace('{Z}', z) for t in self.templates]
+        s = self.subdomains[(int(coordinate.column) + int(coordinate.row)) % len(self.subdomains)]
+        return [t.replace('{S}', s).replace('{X}', x).replace('{Y}', y).replace('{Z}', z) for t in self.templates]
+
+    def getAlternateUrl(self, url):
+        """ Return the same tile from the next subdomain along, for templates with {S}.
+        """
+        for pattern in self.patterns:
+            match = pattern.match(url)
+
+            if match:
+                index = (self.subdomains.index(match.group('S')) + 1) % len(self.subdomains)
+                return url[:match.start('S')] + self.subdomains[index] + url[match.end('S'):]
+
+        return url
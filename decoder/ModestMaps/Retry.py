@@ -0,0 +1,110 @@
+"""
+>>> budget = RetryBudget(3)
+>>> budget.take(2), budget.take(2), budget.take(1)
+(True, False, True)
+
+>>> 0 <= backoff(1) <= 1 and 0 <= backoff(10) <= BACKOFF_CAP
+True
+
+>>> breaker = CircuitBreaker(threshold=2, cooldown=60)
+>>> breaker.failure('tiles.example.com')
+>>> breaker.allow('tiles.example.com')
+True
+>>> breaker.failure('tiles.example.com')
+>>> breaker.allow('tiles.example.com')
+False
+>>> breaker.success('tiles.example.com')
+>>> breaker.allow('tiles.example.com')
+True
+"""
+
+import time
+import random
+import threading
+
+# seconds of backoff before the first retry at most, doubling after that
+BACKOFF_BASE = .5
+
+# most seconds of backoff before any one retry
+BACKOFF_CAP = 8
+
+class TileUnavailable(IOError):
+    """ A tile that's known to be failing, and not worth retrying right now.
+    """
+    pass
+
+class TileMissing(TileUnavailable):
+    """ A tile the server says doesn't exist, already remembered as missing.
+    """
+    pass
+
+def backoff(attempt):
+    """ Return seconds to wait before retrying after a numbered attempt.
+
+        Exponential with full jitter, so tiles failing together
+        don't all come back at the same moment.
+    """
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+
+class RetryBudget:
+    """ Seconds of backoff shared by all the tiles of one map.
+    """
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.lock = threading.Lock()
+
+    def take(self, seconds):
+        """ Spend seconds from the budget, returning False if there isn't enough left.
+        """
+        with self.lock:
+            if seconds > self.seconds:
+                return False
+
+            self.seconds -= seconds
+            return True
+
+class CircuitBreaker:
+    """ Fail fast for tile hosts that are down.
+
+        After threshold failures in a row a host's circuit opens, and
+        requests to it are refused for cooldown seconds. Then one request
+        is let through to probe it: success closes the circuit again,
+        failure keeps it open for another cooldown.
+    """
+    def __init__(self, threshold=5, cooldown=30):
+        self.threshold = threshold
+        self.cooldown = cooldown
+
+        self.lock = threading.Lock()
+        self.failures = {}
+        self.opened = {}
+
+    def allow(self, host):
+        """ Return True if a request to a host may go ahead.
+        """
+        with self.lock:
+            if host not in self.opened:
+                return True
+
+            if time.time() < self.opened[host] + self.cooldown:
+                return False
+
+            # let this one probe through, and hold the rest until it's back
+            self.opened[host] = time.time()
+            return True
+
+    def success(self, host):
+        with self.lock:
+            self.failures.pop(host, None)
+            self.opened.pop(host, None)
+
+    def failure(self, host):
+        with self.lock:
+            self.failures[host] = self.failures.get(host, 0) + 1
+
+            if self.failures[host] >= self.threshold:
+                self.opened[host] = time.time()
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
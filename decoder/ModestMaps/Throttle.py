@@ -0,0 +1,197 @@
+"""
+>>> from tempfile import mkdtemp
+>>> limiter = HostLimiter(mkdtemp(), initial=2, maximum=4)
+>>> a = limiter.acquire('tiles.example.com')
+>>> b = limiter.acquire('tiles.example.com')
+>>> limiter.acquire('tiles.example.com', timeout=0) is None
+True
+>>> limiter.release(a, latency=.1, ok=True)
+>>> limiter.limit('tiles.example.com')
+2.5
+>>> limiter.release(b, latency=.1, ok=False)
+>>> limiter.limit('tiles.example.com')
+1.25
+"""
+
+import os
+import json
+import time
+import fcntl
+import tempfile
+import threading
+import urllib.parse
+
+# defaults for the shared limiter, overridable through the environment
+DEFAULT_DIRECTORY = os.path.join(tempfile.gettempdir(), 'modestmaps-hosts')
+DEFAULT_MAXIMUM = 16
+
+class NoFreeSlot(IOError):
+    """ Every slot for a host is taken by requests on this machine.
+
+        This says nothing about the health of the host itself.
+    """
+    pass
+
+class HostLimiter:
+    """ Additive-increase, multiplicative-decrease limit on requests per tile host.
+
+        The limit for each host lives in a small state file, and each
+        request in flight holds an flock on one of limit numbered slot
+        files. Every process on a machine pointed at the same directory
+        shares the same limits, and slots held by a process that dies
+        are freed by the kernel.
+
+        A good response raises a host's limit by one over the limit, so
+        about one per round of requests. An error, a throttling response
+        or a response much slower than usual halves it, at most once
+        per BACKOFF_INTERVAL.
+    """
+
+    # seconds between checks for a free slot, doubling while none turns up
+    POLL_INTERVAL = .05
+    MAX_POLL_INTERVAL = .4
+
+    # seconds a waiting request goes between readings of the host's limit
+    LIMIT_INTERVAL = .5
+
+    # seconds between decreases of any one limit
+    BACKOFF_INTERVAL = 1
+
+    # how much slower than the average a response must be to count as congestion
+    SLOW_FACTOR = 3
+
+    # weight of each new latency in the moving average
+    SMOOTHING = .2
+
+    def __init__(self, directory, initial=8, maximum=DEFAULT_MAXIMUM):
+        self.directory = directory
+        self.initial = initial
+        self.maximum = maximum
+
+        # per-host directories this process has already made
+        self.dirnames = set()
+
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, host, name):
+        """ Return the path of a per-host file.
+        """
+        dirname = os.path.join(self.directory, urllib.parse.quote(host, safe=''))
+
+        if dirname not in self.dirnames:
+            os.makedirs(dirname, exist_ok=True)
+            self.dirnames.add(dirname)
+
+        return os.path.join(dirname, name)
+
+    def state(self, host):
+        try:
+            with open(self.path(host, 'state')) as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return dict(limit=self.initial, latency=None, decreased=0)
+
+    def limit(self, host):
+        """ Return the current concurrency limit for a host.
+        """
+        return self.state(host)['limit']
+
+    def acquire(self, host, timeout=None):
+        """ Wait for a free slot on a host and return it, or None after timeout seconds.
+
+            Slot files stay open while waiting, and the host's limit is
+            read again only every LIMIT_INTERVAL, so a long wait costs
+            little more than an flock per slot per poll.
+        """
+        due = None if timeout is None else time.time() + timeout
+        interval, files, checked = HostLimiter.POLL_INTERVAL, {}, 0
+
+        try:
+            while True:
+                if time.time() >= checked + HostLimiter.LIMIT_INTERVAL:
+                    limit, checked = max(1, int(self.limit(host))), time.time()
+
+                for index in range(limit):
+                    if index not in files:
+                        files[index] = open(self.path(host, 'slot-%d' % index), 'a')
+
+                    try:
+                        fcntl.flock(files[index], fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    except BlockingIOError:
+                        continue
+                    else:
+                        return host, files.pop(index)
+
+                if due is not None and time.time() >= due:
+                    return None
+
+                sleep = interval if due is None else min(interval, max(0, due - time.time()))
+                time.sleep(sleep)
+
+                interval = min(interval * 2, HostLimiter.MAX_POLL_INTERVAL)
+
+        finally:
+            for file in files.values():
+                file.close()
+
+    def release(self, slot, latency, ok):
+        """ Give back a slot, adjusting the host's limit by how its request went.
+        """
+        host, file = slot
+        file.close()
+
+        with open(self.path(host, '.lock'), 'w') as lockfile:
+            fcntl.flock(lockfile, fcntl.LOCK_EX)
+
+            state = self.state(host)
+            average = state['latency']
+
+            if ok and average is not None and latency > average * HostLimiter.SLOW_FACTOR:
+                # slow enough to mean the host is struggling
+                ok = False
+
+            if ok:
+                state['limit'] = min(self.maximum, state['limit'] + 1. / state['limit'])
+
+            elif time.time() > state['decreased'] + HostLimiter.BACKOFF_INTERVAL:
+                state['limit'] = max(1, state['limit'] / 2)
+                state['decreased'] = time.time()
+
+            if average is None:
+                state['latency'] = latency
+            else:
+                state['latency'] = average + HostLimiter.SMOOTHING * (latency - average)
+
+            handle, tmpname = tempfile.mkstemp(dir=os.path.dirname(lockfile.name), prefix='.tmp-')
+
+            with os.fdopen(handle, 'w') as file:
+                json.dump(state, file)
+
+            os.replace(tmpname, self.path(host, 'state'))
+
+_default_limiter, _default_limiter_lock = None, threading.Lock()
+
+def defaultLimiter():
+    """ Return a process-wide HostLimiter configured from the environment.
+
+        TILE_LIMIT_DIR sets the directory shared between processes and may
+        be empty to disable limiting, TILE_HOST_CONCURRENCY sets the most
+        requests any one host will see at once.
+    """
+    global _default_limiter
+
+    with _default_limiter_lock:
+        if _default_limiter is None:
+            directory = os.environ.get('TILE_LIMIT_DIR', DEFAULT_DIRECTORY)
+
+            if directory:
+                maximum = int(os.environ.get('TILE_HOST_CONCURRENCY', DEFAULT_MAXIMUM))
+                _default_limiter = HostLimiter(directory, maximum=maximum)
+            else:
+                _default_limiter = False
+
+    return _default_limiter or None
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
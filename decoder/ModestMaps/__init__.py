@@ -2,7 +2,10 @@
 >>> m = Map(Microsoft.RoadProvider(), Point(600, 600), Coordinate(3165, 1313, 13), Point(-144, -94))
 >>> p = m.locationPoint(Location(37.804274, -122.262940))
 >>> p
-(370.724, 342.549)
+(370.752, 342.626)
+>>> xs, ys = m.locationPointArrays([37.804274], [-122.262940])
+>>> xs.round(3).tolist(), ys.round(3).tolist()
+([370.752], [342.626])
 >>> m.pointLocation(p)
 (37.804, -122.263)
 
@@ -60,6 +63,15 @@
 (197.000, 81.000 @9.000)
 >>> m.offset
 (-246.000, -179.000)
+
+>>> sw = Location(36.893326, -123.533554)
+>>> ne = Location(38.864246, -121.208153)
+>>> z = 10
+>>> m = mapByExtentZoom(TemplatedMercatorProvider('http://tile.example.com/{Z}/{X}/{Y}.png', tile_size=512), sw, ne, z)
+>>> m.dimensions
+(1693.000, 1818.000)
+>>> m.coordinate
+(197.000, 81.000 @9.000)
 """
 
 import os.path
@@ -67,11 +79,14 @@ import os.path
 __version__ = open(os.path.join(os.path.dirname(__file__), 'VERSION')).read().strip()
 
 import sys
-import urllib
+import urllib.parse
 from io import BytesIO
 import math
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import requests
 
 try:
     import Image
@@ -87,6 +102,13 @@ from .Tiles import *
 from .Providers import *
 from .Core import Point, Coordinate
 from .Geo import Location
+from .Cache import defaultCache, freshness, validators, VALIDATORS, MISSING_TTL, FAILED_TTL, FAILED
+from . import Http
+from .Flight import SingleFlight
+from .Retry import TileUnavailable, TileMissing, RetryBudget, CircuitBreaker, backoff
+from .Metrics import TileMetrics, LatencyWindow, emitMetrics
+from .Composite import composite, decodeTile, verifyTile
+from . import MBTiles, PMTiles
 from .Yahoo import RoadProvider as YahooRoadProvider, AerialProvider as YahooAerialProvider, HybridProvider as YahooHybridProvider
 from .Microsoft import RoadProvider as MicrosoftRoadProvider, AerialProvider as MicrosoftAerialProvider, HybridProvider as MicrosoftHybridProvider
 from .BlueMarble import Provider as BlueMarbleProvider
@@ -94,6 +116,8 @@ from .OpenStreetMap import Provider as OSMProvider
 from .CloudMade import OriginalProvider, FineLineProvider, TouristProvider, FreshProvider, PaleDawnProvider, MidnightCommanderProvider
 from .MapQuest import RoadProvider as MapQuestRoadProvider, AerialProvider as MapQuestAerialProvider
 from .Stamen import TonerProvider, TerrainProvider, WatercolorProvider
+from .MBTiles import Provider as MBTilesProvider
+from .PMTiles import Provider as PMTilesProvider
 import time
 
 # a handy list of possible providers, which isn't
@@ -121,10 +145,20 @@ builtinProviders = {
     'STAMEN_WATERCOLOR': WatercolorProvider,
     }
 
+def tileZoom(provider, zoom):
+    """ Return the zoom of a provider's tiles at the scale of 256-pixel tiles at a zoom.
+
+        Bigger tiles cover more ground, so 512-pixel tiles come from one zoom
+        level lower, and a map needs a quarter as many of them.
+    """
+    return zoom - int(round(math.log(provider.tileWidth() / 256., 2)))
+
 def mapByCenterZoom(provider, center, zoom, dimensions):
     """ Return map instance given a provider, center location, zoom value, and dimensions point.
+
+        Zoom is at the scale of 256-pixel tiles, whatever the provider's tile size.
     """
-    centerCoord = provider.locationCoordinate(center).zoomTo(zoom)
+    centerCoord = provider.locationCoordinate(center).zoomTo(tileZoom(provider, zoom))
     mapCoord, mapOffset = calculateMapCenter(provider, centerCoord)
 
     return Map(provider, dimensions, mapCoord, mapOffset)
@@ -138,7 +172,11 @@ def mapByExtent(provider, locationA, locationB, dimensions):
     
 def mapByExtentZoom(provider, locationA, locationB, zoom):
     """ Return map instance given a provider, two corner locations, and zoom value.
+
+        Zoom is at the scale of 256-pixel tiles, whatever the provider's tile size.
     """
+    zoom = tileZoom(provider, zoom)
+
     # a coordinate per corner
     coordA = provider.locationCoordinate(locationA).zoomTo(zoom)
     coordB = provider.locationCoordinate(locationB).zoomTo(zoom)
@@ -178,7 +216,7 @@ def calculateMapExtent(provider, width, height, *args):
         returns the coordinate of an initial tile and its point placement,
         relative to the map center.
     """
-    coordinates = map(provider.locationCoordinate, args)
+    coordinates = list(map(provider.locationCoordinate, args))
     
     TL = Coordinate(min([c.row for c in coordinates]),
                          min([c.column for c in coordinates]),
@@ -221,6 +259,25 @@ def calculateMapExtent(provider, width, height, *args):
     
     return calculateMapCenter(provider, centerCoord)
     
+# how many tiles to load at once, across every map in the process
+WORKERS = int(os.environ.get('TILE_WORKERS', 32))
+
+_workers, _workers_lock = None, threading.Lock()
+
+def submit(fn, *args):
+    """ Call a function in the process-wide tile workers, and return a Future.
+
+        The same bounded pool of threads is reused by every map drawn in
+        this process, so multi-page jobs don't start and stop threads.
+    """
+    global _workers
+
+    with _workers_lock:
+        if _workers is None:
+            _workers = ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix='ModestMaps')
+
+    return _workers.submit(fn, *args)
+
 def printlocked(lock, *stuff):
     """
     """
@@ -228,11 +285,218 @@ def printlocked(lock, *stuff):
         print(' '.join([str(thing) for thing in stuff]), file=sys.stderr)
         lock.release()
 
+# tile loads in progress, by URL
+inflight = SingleFlight()
+
+# tile hosts that are down
+breaker = CircuitBreaker()
+
+# responses meaning a tile isn't there, rather than failing
+MISSING = 404, 410
+
+# percentile of recent latency after which to hedge a tile request, or 0 not to
+HEDGE_PERCENTILE = float(os.environ.get('TILE_HEDGE_PERCENTILE') or 0)
+
+# recent tile request latencies, by host
+recent = LatencyWindow()
+
+# local tile archives, by URL scheme
+ARCHIVES = dict(mbtiles=MBTiles.openArchive, pmtiles=PMTiles.openArchive)
+
+def readArchiveTile(url):
+    """ Read the bytes of a tile from a local archive, or None if it's not there.
+
+        Archive URLs look like mbtiles:///path/to/file.mbtiles?z=16&x=10507&y=25322.
+    """
+    scheme, netloc, path, params, query, fragment = urllib.parse.urlparse(url)
+    tile = dict(urllib.parse.parse_qsl(query))
+    archive = ARCHIVES[scheme](netloc + path)
+
+    return archive.read(int(tile['z']), int(tile['x']), int(tile['y']))
+
+def readTile(url, disk=None, metrics=None, alternate=None):
+    """ Read the bytes of a tile URL from an archive, the disk cache or over HTTP.
+
+        Returns a status code, the body or None, and a flag for whether
+        the body came from disk. Bodies that aren't images raise IOError
+        and are never cached, so they're retried like failed requests.
+        Stale tiles in the cache are revalidated
+        with a conditional GET and reused on a 304 response. Missing
+        tiles are remembered and returned as 404, and tiles that have
+        been failing lately raise TileUnavailable without a request.
+        An optional alternate URL is used to hedge slow requests.
+    """
+    key = urllib.parse.urlparse(url)
+
+    if key.scheme in ARCHIVES:
+        body = readArchiveTile(url)
+
+        if body is None:
+            return 404, None, False
+
+        verifyTile(body)
+        return 200, body, True
+
+    key = key.netloc, key.path, key.query
+    metrics = metrics or TileMetrics()
+
+    body, meta = disk.lookup(key) if disk else (None, None)
+    status = meta.get('status', 200) if meta else 200
+
+    if body is not None and meta['expires'] >= time.time():
+        metrics.count(key[0], 'hits')
+
+        if status in MISSING:
+            return 404, None, True
+
+        if status != 200:
+            raise TileUnavailable('Tile failed recently: %s' % url)
+
+        return 200, body, True
+
+    if status != 200:
+        # an expired negative entry, nothing to revalidate
+        body = None
+
+    saved = meta.get('headers', {}) if body is not None else {}
+    response = fetchTile(url, metrics, validators(saved), alternate)
+
+    if response.status_code == 304 and body is not None:
+        metrics.count(key[0], 'revalidated')
+
+        # the server may have sent along fresher headers
+        headers = dict(saved, **dict([(name, response.headers[name]) for name in VALIDATORS if name in response.headers]))
+        disk.put(key, body, freshness(response.headers), headers)
+
+        return 200, body, True
+
+    if response.status_code in MISSING:
+        if disk:
+            ttl = freshness(response.headers)
+            disk.put(key, b'', MISSING_TTL if ttl is None else ttl, status=response.status_code)
+
+        return 404, None, False
+
+    response.raise_for_status()
+    verifyTile(response.content)
+
+    if disk:
+        disk.put(key, response.content, freshness(response.headers), response.headers)
+
+    return 200, response.content, False
+
+def fetchTile(url, metrics, headers=None, alternate=None):
+    """ GET a tile URL over HTTP, counting it in a TileMetrics, and return a response.
+
+        Raises TileUnavailable without a request if the host is down.
+        With TILE_HEDGE_PERCENTILE set, a request slower than that
+        percentile of the host's recent requests is hedged by a second
+        one to the alternate URL, or the same URL again. Both requests
+        and the bytes of both responses are counted, against the host
+        each one went to.
+    """
+    host = urllib.parse.urlparse(url).netloc
+
+    if not breaker.allow(host):
+        metrics.count(host, 'rejected')
+        raise TileUnavailable('Tile host is down: %s' % host)
+
+    start = time.time()
+
+    metrics.count(host, 'misses')
+    metrics.count(host, 'requests')
+
+    delay = recent.percentile(host, HEDGE_PERCENTILE) if HEDGE_PERCENTILE else None
+
+    # the host of any hedged second request, and a count of the slower response
+    other = urllib.parse.urlparse(alternate or url).netloc
+    spare = lambda slower, response: metrics.count(urllib.parse.urlparse(slower).netloc, 'bytes', len(response.content))
+    won = False
+
+    try:
+        if delay is None:
+            response = Http.get(url, headers)
+        else:
+            response, hedged, won = Http.hedgedGet(url, alternate or url, delay, headers, spare)
+
+            if hedged:
+                metrics.count(host, 'hedged')
+                metrics.count(other, 'requests')
+
+            if won:
+                metrics.count(host, 'hedge_wins')
+    except (requests.ConnectionError, requests.Timeout):
+        # only trouble reaching the host counts against it, not local limits
+        breaker.failure(host)
+        raise
+
+    if response.status_code == 429 or response.status_code >= 500:
+        breaker.failure(host)
+    else:
+        breaker.success(host)
+
+    metrics.latency(host, time.time() - start)
+    metrics.count(other if won else host, 'bytes', len(response.content))
+    recent.add(host, time.time() - start)
+
+    if response.status_code in MISSING:
+        metrics.count(host, 'not_found')
+
+    return response
+
+def markFailed(url, disk):
+    """ Remember for a little while that a tile URL keeps failing.
+    """
+    key = urllib.parse.urlparse(url)
+
+    if disk and key.scheme in ('http', 'https'):
+        disk.put((key.netloc, key.path, key.query), b'', FAILED_TTL, status=FAILED)
+
+def prefetchTile(url, disk, metrics=None):
+    """ Make sure a tile URL is in the disk cache, without decoding it.
+
+        Goes through the same in-flight calls as maps, so a map asking for
+        a tile still being prefetched waits for it instead of fetching it
+        again. Returns True if the tile is now cached.
+    """
+    status, body, stored = inflight.do(url, readTile, url, disk, metrics)
+
+    return status == 200
+
+def prefetchTiles(urls, timeout=None):
+    """ Load a list of tile URLs into the disk cache in the shared workers.
+
+        Returns the number of tiles cached before the optional timeout.
+    """
+    disk = defaultCache()
+
+    if not disk:
+        return 0
+
+    metrics = TileMetrics()
+    futures = [submit(prefetchTile, url, disk, metrics) for url in urls]
+
+    start = time.time()
+    wait(futures, timeout=timeout)
+    metrics.waited = time.time() - start
+
+    for future in futures:
+        if future.cancel():
+            metrics.unfinished += 1
+
+    emitMetrics(metrics.report())
+
+    return len([future for future in futures if future.done() and not future.cancelled()
+                and future.exception() is None and future.result()])
+
 class TileRequest:
     
     # how many times to retry a failing tile
     MAX_ATTEMPTS = 5
 
+    # how many zoom levels to look up for a missing tile
+    MAX_OVERZOOM = 3
+
     def __init__(self, provider, coord, offset):
         self.done = False
         self.provider = provider
@@ -243,14 +507,25 @@ class TileRequest:
         return self.done
     
     def images(self):
+        """ Return encoded bytes or a decoded image for each layer, or None where missing.
+        """
         return self.imgs
     
-    def load(self, lock, verbose, cache, fatbits_ok, attempt=1, scale=1):
+    def load(self, lock, verbose, cache, fatbits_ok, attempt=1, disk=None, due=None, metrics=None, budget=None):
+        """ Load images for this tile, from cache or from the provider.
+
+            cache is a dictionary shared by all tiles in a map, disk
+            is an optional Cache.TileCache shared by all processes, due
+            is an optional time after which to stop retrying, metrics
+            is an optional Metrics.TileMetrics to count loads in, and
+            budget is an optional Retry.RetryBudget for backing off.
+        """
         if self.done:
             # don't bother?
             return
 
         urls = self.provider.getTileUrls(self.coord)
+        metrics = metrics or TileMetrics()
         
         if verbose:
             printlocked(lock, 'Requesting', urls, '- attempt no.', attempt, 'in thread', hex(threading.get_ident()))
@@ -261,68 +536,86 @@ class TileRequest:
         
             for url in urls:
                 scheme, netloc, path, params, query, fragment = urllib.parse.urlparse(url)
+
                 if (netloc, path, query) in cache:
                     if lock.acquire():
-                        img = cache[(netloc, path, query)].copy()
+                        body = cache[(netloc, path, query)]
                         lock.release()
 
+                    imgs.append(body)
+                    metrics.count(netloc, 'hits')
+
                     if verbose:
                         printlocked(lock, 'Found', urllib.parse.urlunparse(('http', netloc, path, '', query, '')), 'in cache')
             
                 elif scheme in ('file', ''):
-                    img = Image.open(path).convert(mode='RGBA')
-                    imgs.append(img)
+                    with open(path, 'rb') as file:
+                        body = file.read()
+
+                    imgs.append(body)
 
                     if lock.acquire():
-                        cache[(netloc, path, query)] = img
+                        cache[(netloc, path, query)] = body
                         lock.release()
                 
-                elif scheme in ('http', 'https'):
-                    response = urllib.request.urlopen(urllib.request.Request(url, headers={'User-Agent': 'Field Papers (http://fieldpapers.org/)'}, method='GET'))
-                    status = str(response.status)
+                elif scheme in ('http', 'https') or scheme in ARCHIVES:
+                    # share one fetch with any other tile after this URL
+                    alternate = self.provider.getAlternateUrl(url)
+                    status, body, stored = inflight.do(url, readTile, url, disk, metrics, alternate)
                     
-                    if status.startswith('2'):
-                        img = Image.open(BytesIO(response.read())).convert(mode='RGBA')
-                        imgs.append(img)
+                    if status == 200:
+                        imgs.append(body)
     
                         if lock.acquire():
-                            cache[(netloc, path, query)] = img
+                            cache[(netloc, path, query)] = body
                             lock.release()
+
+                        if verbose and stored:
+                            printlocked(lock, 'Found', url, 'in disk cache')
                     
-                    elif status == '404' and fatbits_ok:
+                    elif status == 404 and fatbits_ok:
                         #
                         # We're probably never going to see this tile.
-                        # Try the next lower zoom level for a pixellated output?
+                        # Try lower zoom levels for a pixellated output.
                         #
-                        neighbor = self.coord.zoomBy(-1)
-                        parent = neighbor.container()
-                        
-                        col_shift = 2 * (neighbor.column - parent.column)
-                        row_shift = 2 * (neighbor.row - parent.row)
-                        
-                        # sleep for a second or two, helps prime the image cache
-                        time.sleep(col_shift + row_shift/2)
-                        
-                        x_shift = scale * self.provider.tileWidth() * col_shift
-                        y_shift = scale * self.provider.tileHeight() * row_shift
-                        
-                        self.offset.x -= int(x_shift)
-                        self.offset.y -= int(y_shift)
-                        self.coord = parent
-    
-                        return self.load(lock, verbose, cache, fatbits_ok, attempt+1, scale*2)
+                        img = self.overzoom(urls.index(url), lock, cache, disk, metrics)
 
-            if scale > 1:
-                imgs = [img.resize((img.size[0] * scale, img.size[1] * scale)) for img in imgs]
+                        if img is not None:
+                            imgs.append(img)
+
+                            if verbose:
+                                printlocked(lock, 'Overzoomed', url, 'from a lower zoom level')
+
+                    else:
+                        raise TileMissing('Tile not found: %s' % url)
                 
+        except TileUnavailable as e:
+            if verbose:
+                printlocked(lock, 'Unavailable', urls, '- attempt no.', attempt, 'in thread', hex(threading.get_ident()))
+
+            if attempt > 1 and not isinstance(e, TileMissing):
+                # failed before it was known to be unavailable, but
+                # leave a missing tile's negative entry as it is
+                markFailed(url, disk)
+
+            imgs = [None for url in urls]
+
         except:
             if verbose:
                 printlocked(lock, 'Failed', urls, '- attempt no.', attempt, 'in thread', hex(threading.get_ident()))
 
-            if attempt < TileRequest.MAX_ATTEMPTS:
-                time.sleep(1 * attempt)
-                return self.load(lock, verbose, cache, fatbits_ok, attempt+1, scale)
+            delay = backoff(attempt)
+
+            if attempt < TileRequest.MAX_ATTEMPTS and (due is None or time.time() + delay < due) \
+               and (budget is None or budget.take(delay)):
+                for url in urls:
+                    metrics.count(urllib.parse.urlparse(url).netloc, 'retries')
+
+                time.sleep(delay)
+                return self.load(lock, verbose, cache, fatbits_ok, attempt+1, disk, due, metrics, budget)
             else:
+                # spare other maps from trying the failing URL for a while
+                markFailed(url, disk)
                 imgs = [None for url in urls]
 
         else:
@@ -334,6 +627,54 @@ class TileRequest:
             self.done = True
             lock.release()
 
+    def overzoom(self, index, lock, cache, disk=None, metrics=None):
+        """ Return a decoded image for one missing layer of this tile, or None.
+
+            The image is cropped out of the nearest available ancestor tile
+            and scaled up, so the four children of a parent share one load.
+        """
+        for distance in range(1, TileRequest.MAX_OVERZOOM + 1):
+            if self.coord.zoom - distance < 0:
+                break
+
+            parent = self.coord.zoomBy(-distance).container()
+            url = self.provider.getTileUrls(parent)[index]
+            scheme, netloc, path, params, query, fragment = urllib.parse.urlparse(url)
+
+            if (netloc, path, query) in cache:
+                if lock.acquire():
+                    body = cache[(netloc, path, query)]
+                    lock.release()
+
+                if metrics:
+                    metrics.count(netloc, 'hits')
+
+            else:
+                try:
+                    alternate = self.provider.getAlternateUrl(url)
+                    status, body, stored = inflight.do(url, readTile, url, disk, metrics, alternate)
+                except:
+                    continue
+
+                if status != 200:
+                    continue
+
+                if lock.acquire():
+                    cache[(netloc, path, query)] = body
+                    lock.release()
+
+            img = decodeTile(BytesIO(body))
+
+            # this tile's share of the parent, in the parent's pixels
+            scale = 2 ** distance
+            width, height = img.size[0] // scale, img.size[1] // scale
+            left = int(self.coord.column - parent.column * scale) * width
+            top = int(self.coord.row - parent.row * scale) * height
+
+            return img.crop((left, top, left + width, top + height)).resize(img.size, Image.NEAREST)
+
+        return None
+
 class TileQueue(list):
     """ List of TileRequest objects, that's sensitive to when they're loaded.
     """
@@ -358,6 +699,12 @@ class TileQueue(list):
 
 class Map:
 
+    # seconds to wait for all of a map's tiles before drawing what we have
+    DEADLINE = 40
+
+    # seconds all of a map's tiles may spend backing off before retries
+    RETRY_BUDGET = 10
+
     def __init__(self, provider, dimensions, coordinate, offset):
         """ Instance of a map intended for drawing to an image.
         
@@ -377,6 +724,9 @@ class Map:
         self.dimensions = dimensions
         self.coordinate = coordinate
         self.offset = offset
+
+        # submitted tile loads waiting to be drawn, by fatbits_ok
+        self.pending = {}
         
     def __str__(self):
         return 'Map(%(provider)s, %(dimensions)s, %(coordinate)s, %(offset)s)' % self.__dict__
@@ -384,18 +734,26 @@ class Map:
     def locationPoint(self, location):
         """ Return an x, y point on the map image for a given geographical location.
         """
-        point = Point(self.offset.x, self.offset.y)
         coord = self.provider.locationCoordinate(location).zoomTo(self.coordinate.zoom)
         
         # distance from the known coordinate offset
-        point.x += self.provider.tileWidth() * (coord.column - self.coordinate.column)
-        point.y += self.provider.tileHeight() * (coord.row - self.coordinate.row)
+        x = self.offset.x + self.provider.tileWidth() * (coord.column - self.coordinate.column)
+        y = self.offset.y + self.provider.tileHeight() * (coord.row - self.coordinate.row)
         
         # because of the center/corner business
-        point.x += self.dimensions.x/2
-        point.y += self.dimensions.y/2
-        
-        return point
+        return Point(x + self.dimensions.x/2, y + self.dimensions.y/2)
+
+    def locationPointArrays(self, lats, lons):
+        """ Like locationPoint(), for NumPy arrays of latitudes and longitudes.
+
+            Returns arrays of x and y values on the map image.
+        """
+        rows, columns = self.provider.locationCoordinateArrays(lats, lons, self.coordinate.zoom)
+
+        xs = self.offset.x + self.provider.tileWidth() * (columns - self.coordinate.column) + self.dimensions.x/2
+        ys = self.offset.y + self.provider.tileHeight() * (rows - self.coordinate.row) + self.dimensions.y/2
+
+        return xs, ys
         
     def pointLocation(self, point):
         """ Return a geographical location on the map image for a given x, y point.
@@ -497,63 +855,112 @@ class Map:
     
     def draw(self, verbose=False, fatbits_ok=False):
         """ Draw map out to a PIL.Image and return it.
+
+            Picks up the tiles from an earlier call to submit(), if any.
         """
-        coord = self.coordinate.copy()
-        corner = Point(int(self.offset.x + self.dimensions.x/2), int(self.offset.y + self.dimensions.y/2))
+        if fatbits_ok not in self.pending:
+            self.submit(verbose, fatbits_ok)
+
+        return self.pending.pop(fatbits_ok).result()
 
-        while corner.x > 0:
-            corner.x -= self.provider.tileWidth()
+    def submit(self, verbose=False, fatbits_ok=False):
+        """ Start loading tiles for this map in the shared workers, return a PendingMap.
+
+            A later call to draw() with the same fatbits_ok finishes the
+            same work, so tiles for one map can load while another is used.
+        """
+        tiles = self.list_tiles()
+
+        self.pending[fatbits_ok] = self.submit_tiles(tiles, self.dimensions.x, self.dimensions.y, verbose, fatbits_ok)
+
+        return self.pending[fatbits_ok]
+
+    def list_tiles(self):
+        """ Return a TileQueue of every tile needed to draw this map.
+        """
+        coord = self.coordinate
+        left, top = int(self.offset.x + self.dimensions.x/2), int(self.offset.y + self.dimensions.y/2)
+
+        while left > 0:
+            left -= self.provider.tileWidth()
             coord = coord.left()
         
-        while corner.y > 0:
-            corner.y -= self.provider.tileHeight()
+        while top > 0:
+            top -= self.provider.tileHeight()
             coord = coord.up()
         
         tiles = TileQueue()
         
-        rowCoord = coord.copy()
-        for y in range(corner.y, self.dimensions.y, self.provider.tileHeight()):
-            tileCoord = rowCoord.copy()
-            for x in range(corner.x, self.dimensions.x, self.provider.tileWidth()):
+        rowCoord = coord
+        for y in range(top, self.dimensions.y, self.provider.tileHeight()):
+            tileCoord = rowCoord
+            for x in range(left, self.dimensions.x, self.provider.tileWidth()):
                 tiles.append(TileRequest(self.provider, tileCoord, Point(x, y)))
                 tileCoord = tileCoord.right()
             rowCoord = rowCoord.down()
 
-        return self.render_tiles(tiles, self.dimensions.x, self.dimensions.y, verbose, fatbits_ok)
+        return tiles
 
     #
     
     def render_tiles(self, tiles, img_width, img_height, verbose=False, fatbits_ok=False):
-        
+        """ Load a list of tiles and draw them out to a PIL.Image.
+        """
+        return self.submit_tiles(tiles, img_width, img_height, verbose, fatbits_ok).result()
+
+    def submit_tiles(self, tiles, img_width, img_height, verbose=False, fatbits_ok=False):
+        """ Start loading a list of tiles in the shared workers, return a PendingMap.
+        """
         lock = threading.Lock()
-        threads = 32
         cache = {}
-        
-        for off in range(0, len(tiles), threads):
-            pool = tiles[off:(off + threads)]
-            
-            for tile in pool:
-                # request all needed images
-                threading.Thread(target=tile.load, args=(lock, verbose, cache, fatbits_ok)).start()
-                
-            # if it takes any longer than 20 sec overhead + 10 sec per tile, give up
-            due = time.time() + 20 + len(pool) * 10
-            
-            while time.time() < due and pool.pending():
-                # hang around until they are loaded or we run out of time...
-                time.sleep(1)
+        disk = defaultCache()
 
-        mapImg = Image.new('RGB', (img_width, img_height), color=(255, 255, 255))
-        
-        for tile in tiles:
-            try:
-                for img in tile.images():
-                    mapImg.paste(img, box=(tile.offset.x, tile.offset.y), mask=img)
-            except:
-                # something failed to paste, so we ignore it
-                pass
-
-        return mapImg
+        # if it takes any longer than this for the whole map, give up
+        due = time.time() + Map.DEADLINE
+
+        # request tiles from the middle outward, so a late map is still useful
+        ordered = sorted(tiles, key=lambda tile: math.hypot(tile.offset.x + self.provider.tileWidth()/2 - img_width/2,
+                                                            tile.offset.y + self.provider.tileHeight()/2 - img_height/2))
+
+        metrics = TileMetrics()
+        budget = RetryBudget(Map.RETRY_BUDGET)
+        futures = [submit(tile.load, lock, verbose, cache, fatbits_ok, 1, disk, due, metrics, budget) for tile in ordered]
+
+        return PendingMap(tiles, futures, img_width, img_height, due, metrics)
+
+class PendingMap:
+    """ Map whose tiles are being loaded by the shared workers.
+    """
+    def __init__(self, tiles, futures, img_width, img_height, due, metrics):
+        self.tiles = tiles
+        self.futures = futures
+        self.size = img_width, img_height
+        self.due = due
+        self.metrics = metrics
+
+    def done(self):
+        """ True if every tile has finished loading.
+        """
+        return all([future.done() for future in self.futures])
+
+    def result(self):
+        """ Wait for tiles until they are loaded or we run out of time, and return a PIL.Image.
+        """
+        start = time.time()
+        wait(self.futures, timeout=max(0, self.due - time.time()))
+        self.metrics.waited = time.time() - start
+
+        for future in self.futures:
+            # no sense in loading tiles we won't draw
+            future.cancel()
+
+        self.metrics.unfinished = len([tile for tile in self.tiles if not tile.loaded()])
+
+        report = self.metrics.report()
+        report.update(tiles=len(self.tiles), size=self.size)
+        emitMetrics(report)
+
+        return composite(self.tiles, *self.size)
 
 if __name__ == '__main__':
     import doctest
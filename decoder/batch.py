@@ -0,0 +1,147 @@
+""" Render many PDFs in one process from a stream of JSON jobs.
+
+    Each line of input is one job, a JSON object with an "output" path
+    for the PDF and whatever else the render function needs. Each job
+    gets one line of output, a JSON object with its output path and
+    either "ok": true or an "error" message, plus seconds elapsed.
+
+    Imports, fonts and the map tile cache are shared by every job, and
+    a failed job is reported without stopping the ones after it. Jobs
+    are rendered as they arrive, so a producer can wait on each result
+    before it sends the next; jobs that arrive together can have their
+    map tiles planned and prefetched together.
+"""
+
+import os
+import sys
+import json
+import time
+import queue
+import threading
+from collections import deque
+
+from sentry_sdk import capture_exception
+
+
+def write_file(filename, content):
+    """ Write content to a file in place, so readers never see it half-written.
+    """
+    tmpname = '%s.%d.tmp' % (filename, os.getpid())
+
+    with open(tmpname, 'wb') as file:
+        file.write(content)
+
+    os.replace(tmpname, filename)
+
+
+def read_lines(input, lines):
+    """ Put each non-blank line of input on a queue as it arrives, then None at the end.
+    """
+    for line in input:
+        if line.strip():
+            lines.put(line)
+
+    lines.put(None)
+
+
+def parse_job(line):
+    """ Return the job on a line of input, or the error reading it.
+    """
+    try:
+        return json.loads(line)
+    except ValueError as e:
+        return e
+
+
+def begin_job(start, job):
+    """ Return start(job), or None if there's nothing to start or it fails.
+    """
+    if start is None or not isinstance(job, dict):
+        return None
+
+    try:
+        return start(job)
+    except Exception:
+        # the job gets another chance to fail properly when it's rendered
+        return None
+
+
+def run_jobs(render, input=sys.stdin, output=sys.stdout, prepare=None, start=None):
+    """ Call render(job) for each job read from input and write its bytes to job["output"].
+
+        Jobs are rendered one at a time as they're read, and each result
+        is written as soon as its job is done.
+
+        prepare(jobs), if given, is called with each chunk of jobs that
+        arrive together before any of them is rendered, e.g. to prefetch
+        their map tiles. It's allowed to fail, and jobs are rendered anyway.
+
+        start(job), if given, is called for each job already read while
+        the one before it renders, e.g. to begin loading its map tiles.
+        What it returns is passed on as render(job, started), or None if
+        it failed or the job arrived too late.
+
+        Returns the number of jobs that failed.
+    """
+    lines = queue.Queue()
+    threading.Thread(target=read_lines, args=(input, lines), daemon=True).start()
+
+    waiting, finished, failures = deque(), False, 0
+
+    while True:
+        arrived = []
+
+        # take every job that's here, waiting for one only if there's none
+        while not finished:
+            try:
+                line = lines.get(block=not (waiting or arrived))
+            except queue.Empty:
+                break
+
+            if line is None:
+                finished = True
+            else:
+                arrived.append([line, parse_job(line), None])
+
+        if prepare is not None and arrived:
+            try:
+                prepare([job for (_, job, _) in arrived if isinstance(job, dict)])
+            except Exception:
+                capture_exception()
+                print('Failed to prepare jobs', file=sys.stderr)
+
+        waiting.extend(arrived)
+
+        if not waiting:
+            break
+
+        line, job, started = waiting.popleft()
+        began = time.time()
+
+        if waiting:
+            # get the next job going while this one renders
+            waiting[0][2] = begin_job(start, waiting[0][1])
+
+        try:
+            if isinstance(job, Exception):
+                raise job
+
+            content = render(job) if start is None else render(job, started)
+            write_file(job['output'], content)
+
+        except Exception as e:
+            capture_exception()
+            print('Failed job: %s' % line.strip(), file=sys.stderr)
+
+            failures += 1
+            result = dict(ok=False, error='%s: %s' % (e.__class__.__name__, e))
+
+        else:
+            result = dict(ok=True, bytes=len(content))
+
+        result['output'] = job.get('output') if isinstance(job, dict) else None
+        result['elapsed'] = round(time.time() - began, 3)
+
+        print(json.dumps(result), file=output, flush=True)
+
+    return failures
@@ -1,15 +1,63 @@
-import json
-from os import close, write, unlink, stat
-from subprocess import Popen, PIPE
+from io import BytesIO
+from os import close, unlink
+from hashlib import sha1
 from tempfile import mkstemp
+from collections import OrderedDict
 
 from cairo import PDFSurface, Context
 from PIL import Image
 
 from matrixmath import Point as P, Transform
+from pdfwriter import PDFWriter
+
+# images with no more colors than this are flat graphics better kept as PNG,
+# anything more colorful like a map or a photo is smaller as a JPEG.
+PNG_MAX_COLORS = 256
+
+# most bytes of encoded images to keep around for reuse, by content
+ENCODED_CACHE_BYTES = 32 * 1024 * 1024
+
+_encoded, _encoded_bytes = OrderedDict(), 0
+
+def encode_surface(surf, key):
+    """ Return format, bytes, width and height of a cairo ImageSurface encoded for PDF.
+    
+        Encoded images are cached by key, so an image repeated across
+        pages or across PDFs rendered by a process is encoded once.
+    """
+    global _encoded_bytes
+    
+    if key in _encoded:
+        _encoded.move_to_end(key)
+        return _encoded[key]
+    
+    # cairo's ARGB32 is BGRA bytes on little-endian machines, read without alpha
+    dim = surf.get_width(), surf.get_height()
+    img = Image.frombuffer('RGB', dim, surf.get_data(), 'raw', 'BGRX', surf.get_stride(), 1)
+    
+    buffer = BytesIO()
+    
+    if img.getcolors(PNG_MAX_COLORS) is None:
+        format = 'JPEG'
+        img.save(buffer, format, quality=75)
+    else:
+        format = 'PNG'
+        img.save(buffer, format)
+    
+    encoded = format, buffer.getvalue(), dim[0], dim[1]
+    _encoded[key] = encoded
+    _encoded_bytes += len(encoded[1])
+    
+    while _encoded_bytes > ENCODED_CACHE_BYTES and len(_encoded) > 1:
+        _, (_, data, _, _) = _encoded.popitem(last=False)
+        _encoded_bytes -= len(data)
+    
+    return encoded
 
 class Point (P):
 
+    __slots__ = ()
+
     def add(self, other):
         return Point(self.x + other.x, self.y + other.y)
 
@@ -23,11 +71,11 @@ class Affine (Transform):
         return f'[{t[0]:.2f}, {t[1]:.2f}, {t[2]:.2f}], [{t[3]:.2f}, {t[4]:.2f}f, {t[5]:.2f}]'
 
     def terms(self):
-        return tuple(self.matrix[0:2,0:3].flat)
+        return self.a, self.b, self.c, self.d, self.e, self.f
     
     def multiply(self, other):
         out = Transform.multiply(self, other)
-        return Affine(*tuple(out.matrix[0:2,0:3].flat))
+        return Affine(out.a, out.b, out.c, out.d, out.e, out.f)
 
     def translate(self, x, y):
         return Affine(1, 0, x, 0, 1, y).multiply(self)
@@ -50,10 +98,15 @@ class FakeContext:
         surface = PDFSurface(dummy_file, width, height)
         self.context = Context(surface)
 
-        self.commands = []
+        self.pdf = PDFWriter(filename, width, height)
+        self.images = {}
         self.garbage = [dummy_file]
         self.page_commands = []
 
+        # font operator for the current text, carried over from page to page
+        self.font = None
+        self.page_font = None
+
         self.point = Point(0, 0)
         self.stack = [(1, 0, 0, 0, -1, height)]
         self.affine = Affine(*self.stack[0])
@@ -61,33 +114,23 @@ class FakeContext:
     def get_current_point(self):
         return self.point.x, self.point.y
     
-    def command(self, text, *args):
-        self.page_commands.append((text, args))
-
     def raw_command(self, text):
-        self.page_commands.append(('raw', [text]))
+        self.page_commands.append(text)
 
     def show_page(self):
-        # vertically flip everything because FPDF.
-        self.commands.append(('AddPage', []))
+        # square line caps and a thin default line, then vertically flip
+        # everything so y runs down the page like it does in cairo.
         height = self.size[1]
-        self.commands.append(('raw', [f'1 0 0 -1 0 {height:.3f} cm']))
+        commands = ['2 J', '0.57 w', self.page_font, f'1 0 0 -1 0 {height:.3f} cm']
 
-        self.commands += self.page_commands
+        self.pdf.add_page('\n'.join([c for c in commands + self.page_commands if c]))
         self.page_commands = []
+        self.page_font = self.font
 
     def finish(self):
         """
         """
-        info = {
-            'size': self.size,
-            'commands': self.commands,
-            'filename': self.filename
-          }
-        
-        page = Popen(['php', 'lossy/page.php'], stdin=PIPE, text=True)
-        page.communicate(json.dumps(info), timeout=60)
-        page.stdin.close()
+        self.pdf.close()
         
         for filename in self.garbage:
             unlink(filename)
@@ -147,28 +190,22 @@ class FakeContext:
     def set_source_surface(self, surf, x, y):
         """
         """
-        dim = surf.get_width(), surf.get_height()
-        img = Image.frombytes('RGBA', dim, surf.get_data().tobytes())
-        
-        # weird channel order
-        blue, green, red, alpha = img.split()
-        img = Image.merge('RGB', (red, green, blue))
-
-        png_handle, png_filename = mkstemp(prefix='cairoutils-', suffix='.png')
-        img.save(png_filename, 'PNG')
+        w, h = surf.get_width(), surf.get_height()
+        key = sha1(surf.get_data()).digest(), w, h
         
-        jpg_handle, jpg_filename = mkstemp(prefix='cairoutils-', suffix='.jpg')
-        img.save(jpg_filename, 'JPEG', quality=75)
+        if key not in self.images:
+            # each distinct image is written into the PDF once
+            format, data, w, h = encode_surface(surf, key)
+            
+            if format == 'JPEG':
+                self.images[key] = self.pdf.add_jpeg(data, w, h)
+            else:
+                self.images[key] = self.pdf.add_png(data)
         
-        if stat(jpg_filename).st_size < stat(png_filename).st_size:
-            method, handle, filename = 'raw_jpeg', jpg_handle, jpg_filename
-        else:
-            method, handle, filename = 'raw_png', png_handle, png_filename
+        name = self.images[key]
         
-        self.command(method, filename)
-        self.garbage.append(filename)
-
-        close(handle)
+        # PDF's Do operator places the image into a [0,1] unit square
+        self.raw_command(f'q {w:d} 0 0 {-h:d} 0 {h:d} cm {name} Do Q')
 
     def paint(self):
         pass
@@ -196,13 +233,15 @@ class FakeContext:
     def set_font_size(self, size):
         self.context.set_font_size(size)
         
-        # SetFont here because only the size gives a clue to the correct weight
-        self.command('SetFont', 'Helvetica', (size > 14) and 'B' or '')
-        self.command('SetFontSize', size)
+        # choose the font here because only the size gives a clue to the correct weight
+        font = self.pdf.font((size > 14) and 'Helvetica-Bold' or 'Helvetica')
+        self.font = f'BT {font} {size:.2f} Tf ET'
+        self.raw_command(self.font)
 
     def show_text(self, text):
         # invert the vertical flip in self.show_page() before showing text.
         x, y = self.point.x, -self.point.y
+        text = text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
 
         self.raw_command(f'q 1 0 0 -1 0 0 cm BT {x:.3f} {y:.3f} Td ({text}) Tj ET Q')
 
@@ -1,23 +1,25 @@
 #!/usr/bin/env python3
 
 from math import pi
-from copy import copy
 from urllib.parse import urlencode
 from os.path import join as pathjoin, dirname, realpath
 from urllib.parse import urljoin, urlparse, parse_qs
 from os import close, write, unlink
 from optparse import OptionParser
-from io import BytesIO, StringIO
+from io import StringIO
 from tempfile import mkstemp
-import subprocess
+from functools import lru_cache
 import sys
 
-from ModestMaps import mapByExtent, mapByExtentZoom
+import numpy
+import qrcode
+
+from ModestMaps import mapByExtent, mapByExtentZoom, prefetchTiles, tileZoom
 from ModestMaps.Providers import TemplatedMercatorProvider
 from ModestMaps.Geo import Location
 from ModestMaps.Core import Point
 
-from cairo import ImageSurface
+from cairo import ImageSurface, FORMAT_ARGB32
 
 from svgutils import create_cairo_font_face_for_file, place_image, draw_box, draw_circle, draw_cross, flow_text
 from dimensions import point_A, point_B, point_C, point_D, point_E, ptpin
@@ -26,28 +28,56 @@ from cairoutils import get_drawing_context
 
 cached_fonts = dict()
 
+# most seconds to wait for an atlas's tiles to prefetch before drawing pages
+PREFETCH_TIMEOUT = 30
+
+# pixel size of each QR code module
+QRCODE_MODULE_SIZE = 19
+
+# most QR codes to keep, they're asked for again by re-renders and index pages
+QRCODE_CACHE_SIZE = 64
+
+def get_array_surface(rgb):
+    """ Return an ImageSurface for an array of height x width x 3 RGB bytes.
+
+        Pixels are copied once, straight into the surface's buffer,
+        which cairo reads as BGRA bytes on little-endian machines.
+    """
+    height, width = rgb.shape[:2]
+
+    pixels = numpy.empty((height, width, 4), dtype=numpy.uint8)
+    pixels[:,:,2::-1] = rgb
+    pixels[:,:,3] = 0xff
+
+    return ImageSurface.create_for_data(pixels, FORMAT_ARGB32, width, height)
+
+@lru_cache(maxsize=QRCODE_CACHE_SIZE)
 def get_qrcode_image(print_href):
-    """ Render a QR code to an ImageSurface.
+    """ Render a QR code to an ImageSurface, with no margin around it.
+
+        The surface is cached and shared by every page with the same
+        href, so it's only for painting from; never draw onto it.
     """
-    qr_code = BytesIO(subprocess.Popen("qrencode -m 0 -s 19 -o - %s" % (print_href), shell=True, stdout=subprocess.PIPE).stdout.read())
+    code = qrcode.QRCode(error_correction=qrcode.constants.ERROR_CORRECT_L, border=0)
+    code.add_data(print_href)
+    code.make(fit=True)
+
+    # black modules on white, scaled up to QRCODE_MODULE_SIZE pixels
+    modules = numpy.array(code.get_matrix(), dtype=bool)
+    gray = numpy.where(modules, 0x00, 0xff).astype(numpy.uint8)
+    gray = gray.repeat(QRCODE_MODULE_SIZE, axis=0).repeat(QRCODE_MODULE_SIZE, axis=1)
 
-    return ImageSurface.create_from_png(qr_code)
+    return get_array_surface(numpy.repeat(gray[:,:,None], 3, axis=2))
 
 def get_mmap_image(mmap):
     """ Render a Map to an ImageSurface.
     """
-    handle, filename = mkstemp(prefix='map_image-', suffix='.png')
+    img = mmap.draw(fatbits_ok=False)
 
-    try:
-        close(handle)
-        mmap.draw(fatbits_ok=False).save(filename)
+    if img.mode != 'RGB':
+        img = img.convert('RGB')
 
-        img = ImageSurface.create_from_png(filename)
-
-    finally:
-        unlink(filename)
-
-    return img
+    return get_array_surface(numpy.asarray(img))
 
 def paper_info(paper_size, orientation):
     """ Return page width, height, differentiating points and aspect ration.
@@ -72,6 +102,101 @@ def get_preview_map_size(orientation, paper_size):
 
     return int(width), int(height)
 
+def get_preview_mmap(page_mmap, provider, northwest, southeast):
+    """ Return a smaller preview map for a page, 600px looking like a reasonable upper bound.
+    """
+    preview_mmap = page_mmap
+
+    # back at the scale of 256-pixel tiles, as mapByExtentZoom() expects
+    preview_zoom = page_mmap.coordinate.zoom - tileZoom(provider, 0)
+
+    while preview_mmap.dimensions.x > 600:
+        preview_zoom -= 1
+        preview_mmap = mapByExtentZoom(provider, northwest, southeast, preview_zoom)
+
+    return preview_mmap
+
+def get_page_provider(page):
+    """ Return the map provider for a page's provider URL template and any tile_size.
+    """
+    return TemplatedMercatorProvider(page['provider'], tile_size=page.get('tile_size'))
+
+def get_page_mmap(page):
+    """ Return the map for a page's bounds, zoom, provider and any tile_size.
+    """
+    north, west, south, east = page['bounds']
+
+    return mapByExtentZoom(get_page_provider(page), Location(north, west), Location(south, east), page['zoom'])
+
+def get_atlas_preview_mmap(pages, paper_size, orientation):
+    """ Return a small preview map of the whole print coverage area.
+    """
+    provider = get_page_provider(pages[0])
+
+    norths, wests, souths, easts = zip(*[page['bounds'] for page in pages])
+    northwest = Location(max(norths), min(wests))
+    southeast = Location(min(souths), max(easts))
+
+    dimensions = Point(*get_preview_map_size(orientation, paper_size))
+
+    return mapByExtent(provider, northwest, southeast, dimensions)
+
+def plan_atlas_tiles(pages, paper_size=None, orientation=None, previews=True):
+    """ Return a list of every distinct tile URL needed to render an atlas.
+
+        Pages are dictionaries with provider, zoom, bounds and an optional
+        tile_size, as for main(), and include any index page. With previews, also plan for each page's
+        preview map and, given paper size and orientation, the atlas preview.
+    """
+    mmaps = []
+
+    for page in pages:
+        page_mmap = get_page_mmap(page)
+        mmaps.append(page_mmap)
+
+        if previews:
+            north, west, south, east = page['bounds']
+            mmaps.append(get_preview_mmap(page_mmap, page_mmap.provider, Location(north, west), Location(south, east)))
+
+    if previews and pages and paper_size and orientation:
+        mmaps.append(get_atlas_preview_mmap(pages, paper_size, orientation))
+
+    # a dictionary keeps the URLs in page order
+    urls = dict()
+
+    for mmap in mmaps:
+        for tile in mmap.list_tiles():
+            for url in mmap.provider.getTileUrls(tile.coord):
+                urls[url] = True
+
+    return list(urls.keys())
+
+def prefetch_atlas_tiles(pages, paper_size=None, orientation=None, timeout=PREFETCH_TIMEOUT, previews=True):
+    """ Load every tile needed for an atlas into the tile cache, at once.
+
+        Returns the number of tiles cached, so page renders can run from cache.
+        Gives up waiting after timeout seconds, and the pages load the rest.
+    """
+    urls = plan_atlas_tiles(pages, paper_size, orientation, previews)
+    cached = prefetchTiles(urls, timeout)
+
+    print('Prefetched %d of %d tiles' % (cached, len(urls)), file=sys.stderr)
+
+    return cached
+
+def prefetch_page_tiles(pages):
+    """ Load the map tiles for a batch of single-page jobs into the tile cache together.
+    """
+    prefetch_atlas_tiles(pages, previews=False)
+
+def start_page_mmap(page):
+    """ Start loading the map tiles for a single-page job, and return its map.
+    """
+    page_mmap = get_page_mmap(page)
+    page_mmap.submit(fatbits_ok=False)
+
+    return page_mmap
+
 def add_page_text(ctx, text, x, y, width, height):
     """
     """
@@ -270,17 +395,14 @@ def add_print_page(ctx, mmap, href, well_bounds_pt, points_FG, hm2pt_ratio, layo
     #
     page_numbers = []
 
-    for page in indexees:
-        north, west, south, east = page['bounds']
-
-        ul = mmap.locationPoint(Location(north, west))
-        lr = mmap.locationPoint(Location(south, east))
+    # project every box corner at once, northwest then southeast
+    norths, wests, souths, easts = numpy.array([page['bounds'] for page in indexees], dtype=float).reshape(-1, 4).T
+    xs, ys = mmap.locationPointArrays(numpy.concatenate((norths, souths)), numpy.concatenate((wests, easts)))
 
-        x1 = map_width_pt * float(ul.x) / mmap.dimensions.x
-        x2 = map_width_pt * float(lr.x) / mmap.dimensions.x
-        y1 = map_height_pt * float(ul.y) / mmap.dimensions.y
-        y2 = map_height_pt * float(lr.y) / mmap.dimensions.y
+    xs = (map_width_pt * xs / mmap.dimensions.x).reshape(2, -1).T.tolist()
+    ys = (map_height_pt * ys / mmap.dimensions.y).reshape(2, -1).T.tolist()
 
+    for (page, (x1, x2), (y1, y2)) in zip(indexees, xs, ys):
         draw_box(ctx, x1, y1, x2-x1, y2-y1)
         ctx.set_source_rgb(0, 0, 0)
         ctx.set_line_width(1)
@@ -452,6 +574,12 @@ def main(apibase, password, print_id, pages, paper_size, orientation, layout):
     print_context, finish_drawing = get_drawing_context(print_filename, page_width_pt, page_height_pt)
 
     try:
+        #
+        # Load every tile the atlas needs, once.
+        #
+
+        prefetch_atlas_tiles(pages, paper_size, orientation, PREFETCH_TIMEOUT)
+
         map_xmin_pt = .5 * ptpin
         map_ymin_pt = 1 * ptpin
         map_xmax_pt = page_width_pt - .5 * ptpin
@@ -459,6 +587,8 @@ def main(apibase, password, print_id, pages, paper_size, orientation, layout):
 
         map_bounds_pt = map_xmin_pt, map_ymin_pt, map_xmax_pt, map_ymax_pt
 
+        page_mmaps = [get_page_mmap(page) for page in pages]
+
         #
         # Add pages to the PDF one by one.
         #
@@ -466,39 +596,39 @@ def main(apibase, password, print_id, pages, paper_size, orientation, layout):
         for (index, page) in enumerate(pages):
             _update_print(0.1 + 0.9 * float(index) / len(pages))
 
+            if index + 1 < len(pages):
+                # load tiles for the next page while this one is drawn
+                page_mmaps[index + 1].submit(fatbits_ok=False)
+
             page_href = print_href and (print_href + '/%(number)s' % page) or None
 
-            provider = TemplatedMercatorProvider(page['provider'])
+            provider = get_page_provider(page)
             zoom = page['zoom']
 
             mark = page.get('mark', None) or None
             fuzzy = page.get('fuzzy', None) or None
-            text = unicode(page.get('text', None) or '').encode('utf8')
+            text = page.get('text', None) or ''
+            title = page.get('title', None) or ''
             role = page.get('role', None) or None
 
             north, west, south, east = page['bounds']
             northwest = Location(north, west)
             southeast = Location(south, east)
 
-            page_mmap = mapByExtentZoom(provider, northwest, southeast, zoom)
+            page_mmap = page_mmaps[index]
 
             if role == 'index':
                 indexees = [pages[other] for other in range(len(pages)) if other != index]
             else:
                 indexees = []
 
-            add_print_page(print_context, page_mmap, page_href, map_bounds_pt, points_FG, hm2pt_ratio, layout, text, mark, fuzzy, indexees)
+            add_print_page(print_context, page_mmap, page_href, map_bounds_pt, points_FG, hm2pt_ratio, layout, text, mark, fuzzy, indexees, title)
 
             #
-            # Now make a smaller preview map for the page,
-            # 600px looking like a reasonable upper bound.
+            # Now make a smaller preview map for the page.
             #
 
-            preview_mmap = copy(page_mmap)
-
-            while preview_mmap.dimensions.x > 600:
-                preview_zoom = preview_mmap.coordinate.zoom - 1
-                preview_mmap = mapByExtentZoom(provider, northwest, southeast, preview_zoom)
+            preview_mmap = get_preview_mmap(page_mmap, provider, northwest, southeast)
 
             out = StringIO()
             preview_mmap.draw(fatbits_ok=True).save(out, format='JPEG', quality=85)
@@ -525,15 +655,7 @@ def main(apibase, password, print_id, pages, paper_size, orientation, layout):
     # Make a small preview map of the whole print coverage area.
     #
 
-    provider = TemplatedMercatorProvider(pages[0]['provider'])
-
-    norths, wests, souths, easts = zip(*[page['bounds'] for page in pages])
-    northwest = Location(max(norths), min(wests))
-    southeast = Location(min(souths), max(easts))
-
-    dimensions = Point(*get_preview_map_size(orientation, paper_size))
-
-    preview_mmap = mapByExtent(provider, northwest, southeast, dimensions)
+    preview_mmap = get_atlas_preview_mmap(pages, paper_size, orientation)
 
     out = StringIO()
     preview_mmap.draw(fatbits_ok=True).save(out, format='JPEG', quality=85)
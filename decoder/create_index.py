@@ -7,20 +7,27 @@ from optparse import OptionParser
 from os import close, unlink
 from tempfile import mkstemp
 
-from ModestMaps import mapByExtentZoom
-from ModestMaps.Geo import Location
-from ModestMaps.Providers import TemplatedMercatorProvider
 from sentry_sdk import capture_exception
 
+from batch import run_jobs
 from cairoutils import get_drawing_context
-from compose import add_print_page, paper_info
+from compose import add_print_page, get_page_mmap, paper_info, prefetch_page_tiles, start_page_mmap
 from dimensions import ptpin
 
 
 API_BASE = os.getenv('API_BASE_URL', 'http://fieldpapers.org/')
 
+DEFAULTS = dict(
+    paper_size='letter',
+    orientation='landscape',
+    layout='full-page',
+    text='',
+    title='',
+    tile_size=None,
+)
 
-def render_index(paper_size, orientation, layout, atlas_id, bounds, envelope, zoom, provider, cols, rows, text, title):
+
+def render_index(paper_size, orientation, layout, atlas_id, bounds, envelope, zoom, provider, cols, rows, text, title, tile_size=None, page_mmap=None):
     page_number = "i"
 
     # hm2pt_ratio = homogeneous point coordinate conversation ratio
@@ -45,7 +52,8 @@ def render_index(paper_size, orientation, layout, atlas_id, bounds, envelope, zo
 
     print("page_href: %s" % (page_href), file=sys.stderr)
 
-    page_mmap = mapByExtentZoom(TemplatedMercatorProvider(provider), Location(north, west), Location(south, east), zoom)
+    if page_mmap is None:
+        page_mmap = get_page_mmap(dict(bounds=bounds, zoom=zoom, provider=provider, tile_size=tile_size))
 
     pages = []
 
@@ -79,15 +87,19 @@ def render_index(paper_size, orientation, layout, atlas_id, bounds, envelope, zo
         unlink(print_filename)
 
 
+def render_job(job, page_mmap=None):
+    """ Render an index from a batch job with the same fields as the options, plus atlas.
+    """
+    job = dict(DEFAULTS, **job)
+
+    return render_index(job['paper_size'], job['orientation'], job['layout'], job['atlas'], job['bounds'], job['envelope'], job['zoom'], job['provider'], job['cols'], job['rows'], job['text'], job['title'], job['tile_size'], page_mmap)
+
+
 if __name__ == '__main__':
-    usage = 'usage: %prog [options] atlas'
+    usage = 'usage: %prog [options] atlas\n       %prog --batch < jobs.jsonl'
     parser = OptionParser(usage)
 
-    parser.set_defaults(
-        paper_size='letter',
-        orientation='landscape',
-        layout='full-page',
-    )
+    parser.set_defaults(batch=False, prefetch=False, **DEFAULTS)
 
     papers = 'a3 a4 letter'.split()
     orientations = 'landscape portrait'.split()
@@ -123,15 +135,25 @@ if __name__ == '__main__':
                       help='Body text.')
     parser.add_option('-T', '--title', dest='title', default='',
                       help='Title.')
+    parser.add_option('--tile-size', dest='tile_size',
+                      help='Pixel size of provider tiles, 256 or 512, or one for each template separated by commas. Defaults to TILE_SIZE from the environment, or 256.')
+    parser.add_option('-B', '--batch', dest='batch', action='store_true',
+                      help='Read indexes from STDIN as JSON lines with an output path, the options above and atlas, and report on each to STDOUT.')
+    parser.add_option('-P', '--prefetch', dest='prefetch', action='store_true',
+                      help='With --batch, load the map tiles for indexes that arrive together in one go.')
 
     (opts, args) = parser.parse_args()
+
+    if opts.batch:
+        exit(1 if run_jobs(render_job, prepare=(prefetch_page_tiles if opts.prefetch else None), start=start_page_mmap) else 0)
+
     if len(args) != 1:
         parser.print_help()
         exit(1)
 
     try:
         # write to STDOUT
-        sys.stdout.buffer.write(render_index(opts.paper_size, opts.orientation, opts.layout, args[0], opts.bounds, opts.envelope, opts.zoom, opts.provider, opts.cols, opts.rows, opts.text, opts.title))
+        sys.stdout.buffer.write(render_index(opts.paper_size, opts.orientation, opts.layout, args[0], opts.bounds, opts.envelope, opts.zoom, opts.provider, opts.cols, opts.rows, opts.text, opts.title, opts.tile_size))
     except Exception as e:
         capture_exception()
         raise
@@ -7,20 +7,28 @@ from optparse import OptionParser
 from os import close, unlink
 from tempfile import mkstemp
 
-from ModestMaps import mapByExtentZoom
-from ModestMaps.Geo import Location
-from ModestMaps.Providers import TemplatedMercatorProvider
 from sentry_sdk import capture_exception
 
+from batch import run_jobs
 from cairoutils import get_drawing_context
-from compose import add_print_page, paper_info
+from compose import add_print_page, get_page_mmap, paper_info, prefetch_page_tiles, start_page_mmap
 from dimensions import ptpin
 
 
 API_BASE = os.getenv('API_BASE_URL', 'http://fieldpapers.org/')
 
+DEFAULTS = dict(
+    paper_size='letter',
+    orientation='landscape',
+    layout='full-page',
+    page_number=None,
+    text='',
+    title='',
+    tile_size=None,
+)
 
-def render_page(paper_size, orientation, layout, atlas_id, page_number, bounds, zoom, provider, text, title):
+
+def render_page(paper_size, orientation, layout, atlas_id, page_number, bounds, zoom, provider, text, title, tile_size=None, page_mmap=None):
     # hm2pt_ratio = homogeneous point coordinate conversation ratio
     (page_width_pt, page_height_pt, points_FG, hm2pt_ratio) = paper_info(paper_size, orientation)
 
@@ -43,7 +51,8 @@ def render_page(paper_size, orientation, layout, atlas_id, page_number, bounds,
 
     print("page_href: %s" % (page_href), file=sys.stderr)
 
-    page_mmap = mapByExtentZoom(TemplatedMercatorProvider(provider), Location(north, west), Location(south, east), zoom)
+    if page_mmap is None:
+        page_mmap = get_page_mmap(dict(bounds=bounds, zoom=zoom, provider=provider, tile_size=tile_size))
 
     (handle, print_filename) = mkstemp(suffix='.pdf')
     close(handle)
@@ -55,22 +64,25 @@ def render_page(paper_size, orientation, layout, atlas_id, page_number, bounds,
 
         finish_drawing()
 
-        # write to STDOUT
-        sys.stdout.buffer.write(open(print_filename, 'rb').read())
+        return open(print_filename, 'rb').read()
 
     finally:
         unlink(print_filename)
 
 
+def render_job(job, page_mmap=None):
+    """ Render a page from a batch job with the same fields as the options, plus atlas.
+    """
+    job = dict(DEFAULTS, **job)
+
+    return render_page(job['paper_size'], job['orientation'], job['layout'], job['atlas'], job['page_number'], job['bounds'], job['zoom'], job['provider'], job['text'], job['title'], job['tile_size'], page_mmap)
+
+
 if __name__ == '__main__':
-    usage = 'usage: %prog [options] atlas'
+    usage = 'usage: %prog [options] atlas\n       %prog --batch < jobs.jsonl'
     parser = OptionParser(usage)
 
-    parser.set_defaults(
-        paper_size='letter',
-        orientation='landscape',
-        layout='full-page',
-    )
+    parser.set_defaults(batch=False, prefetch=False, **DEFAULTS)
 
     papers = 'a3 a4 letter'.split()
     orientations = 'landscape portrait'.split()
@@ -99,14 +111,25 @@ if __name__ == '__main__':
                       help='Page text.')
     parser.add_option('-T', '--title', dest='title', default='',
                       help='Title.')
+    parser.add_option('--tile-size', dest='tile_size',
+                      help='Pixel size of provider tiles, 256 or 512, or one for each template separated by commas. Defaults to TILE_SIZE from the environment, or 256.')
+    parser.add_option('-B', '--batch', dest='batch', action='store_true',
+                      help='Read pages from STDIN as JSON lines with an output path, the options above and atlas, and report on each to STDOUT.')
+    parser.add_option('-P', '--prefetch', dest='prefetch', action='store_true',
+                      help='With --batch, load the map tiles for pages that arrive together in one go.')
 
     (opts, args) = parser.parse_args()
+
+    if opts.batch:
+        exit(1 if run_jobs(render_job, prepare=(prefetch_page_tiles if opts.prefetch else None), start=start_page_mmap) else 0)
+
     if len(args) != 1:
         parser.print_help()
         exit(1)
 
     try:
-        render_page(opts.paper_size, opts.orientation, opts.layout, args[0], opts.page_number, opts.bounds, opts.zoom, opts.provider, opts.text, opts.title)
+        # write to STDOUT
+        sys.stdout.buffer.write(render_page(opts.paper_size, opts.orientation, opts.layout, args[0], opts.page_number, opts.bounds, opts.zoom, opts.provider, opts.text, opts.title, opts.tile_size))
     except Exception as e:
         capture_exception()
         raise
@@ -430,7 +430,7 @@ def main(apibase, password, scan_id, url):
                     _update_scan(uploaded_file, 0.5 + 0.5 * float(index) / len(tiles_needed))
                 
                 tile_img = extract_tile_for_coord(input, coord, scan2coord)
-                _append_image('%(zoom)d/%(column)d/%(row)d.jpg' % coord.__dict__, tile_img)
+                _append_image('%(zoom)d/%(column)d/%(row)d.jpg' % coord._asdict(), tile_img)
 
                 print(coord.zoom,)
                 
@@ -1,6 +1,8 @@
 from tempfile import mkstemp
 from os import unlink
 from math import hypot
+
+import numpy
 from osgeo import osr, gdal
 
 try:
@@ -8,8 +10,7 @@ try:
 except ImportError:
     import Image
 
-from ModestMaps.Geo import Location
-from ModestMaps.Core import Coordinate
+from ModestMaps.Core import Coordinate, zoomArrays
 from ModestMaps.OpenStreetMap import Provider as OpenStreetMapProvider
 
 from matrixmath import triangle2triangle
@@ -41,12 +42,13 @@ def calculate_gcps(p2s, paper_width_pt, paper_height_pt, north, west, south, eas
     lr_pt = Point(right_pt, lower_pt)
     
     # x, y in image pixels
-    ul_px, ur_px, lr_px, ll_px = [p2s(pt) for pt in (ul_pt, ur_pt, lr_pt, ll_pt)]
+    pts = ul_pt, ur_pt, lr_pt, ll_pt
+    xs, ys = p2s.apply([pt.x for pt in pts], [pt.y for pt in pts])
     
-    ul_gcp = gdal.GCP(west, north, 0, ul_px.x, ul_px.y)
-    ur_gcp = gdal.GCP(east, north, 0, ur_px.x, ur_px.y)
-    lr_gcp = gdal.GCP(east, south, 0, lr_px.x, lr_px.y)
-    ll_gcp = gdal.GCP(west, south, 0, ll_px.x, ll_px.y)
+    ul_gcp = gdal.GCP(west, north, 0, xs[0], ys[0])
+    ur_gcp = gdal.GCP(east, north, 0, xs[1], ys[1])
+    lr_gcp = gdal.GCP(east, south, 0, xs[2], ys[2])
+    ll_gcp = gdal.GCP(west, south, 0, xs[3], ys[3])
     
     return [ul_gcp, ur_gcp, lr_gcp, ll_gcp]
 
@@ -181,27 +183,28 @@ def list_tiles_for_bounds(image, s2p, paper_width_pt, paper_height_pt, north, we
     osm = OpenStreetMapProvider()
     coords = []
     
+    #
+    # Coordinates of three print corners at every zoom, one row per zoom
+    #
+    
+    rows, cols = osm.locationCoordinateArrays([north, north, south], [west, east, east], 0)
+    rows, cols = zoomArrays(rows, cols, 0, numpy.arange(19).reshape(-1, 1))
+    
     for zoom in range(19):
-        #
-        # Coordinates of three print corners
-        #
-        
-        ul = osm.locationCoordinate(Location(north, west)).zoomTo(zoom)
-        ur = osm.locationCoordinate(Location(north, east)).zoomTo(zoom)
-        lr = osm.locationCoordinate(Location(south, east)).zoomTo(zoom)
+        (ul_row, ur_row, lr_row), (ul_col, ur_col, lr_col) = rows[zoom].tolist(), cols[zoom].tolist()
         
         #
         # Matching points in print and coordinate spaces
         #
         
         ul_pt = Point(1 * ptpin - paper_width_pt, 1.5 * ptpin - paper_height_pt)
-        ul_co = Point(ul.column, ul.row)
+        ul_co = Point(ul_col, ul_row)
     
         ur_pt = Point(0, 1.5 * ptpin - paper_height_pt)
-        ur_co = Point(ur.column, ur.row)
+        ur_co = Point(ur_col, ur_row)
     
         lr_pt = Point(0, 0)
-        lr_co = Point(lr.column, lr.row)
+        lr_co = Point(lr_col, lr_row)
         
         scan_dim = hypot(image.size[0], image.size[1])
         zoom_dim = hypot((lr_co.x - ul_co.x) * 256, (lr_co.y - ul_co.y) * 256)
@@ -230,15 +233,11 @@ def list_tiles_for_bounds_zoom(image, scan2coord, zoom):
     """
     coords = []
     
-    ul = scan2coord(Point(0, 0))
-    ur = scan2coord(Point(image.size[0], 0))
-    lr = scan2coord(Point(*image.size))
-    ll = scan2coord(Point(0, image.size[1]))
+    width, height = image.size
+    cols, rows = scan2coord.apply([0, width, width, 0], [0, 0, height, height])
     
-    minrow = min(ul.y, ur.y, lr.y, ll.y)
-    maxrow = max(ul.y, ur.y, lr.y, ll.y)
-    mincol = min(ul.x, ur.x, lr.x, ll.x)
-    maxcol = max(ul.x, ur.x, lr.x, ll.x)
+    minrow, maxrow = rows.min(), rows.max()
+    mincol, maxcol = cols.min(), cols.max()
     
     for row in range(int(minrow), int(maxrow) + 1):
         for col in range(int(mincol), int(maxcol) + 1):
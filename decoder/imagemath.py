@@ -225,6 +225,7 @@ def extract_image(scan2print, print_bbox, scan_img, dest_dim, step=50):
     # Compute transformation from source image to destination image.
     #
     scan2dest = scan2print.multiply(print2dest)
+    dest2scan = scan2dest.inverse()
     
     dest_w, dest_h = dest_dim
     
@@ -234,10 +235,8 @@ def extract_image(scan2print, print_bbox, scan_img, dest_dim, step=50):
             w = min(step, dest_w - x)
             h = min(step, dest_h - y)
 
-            # transformation from scan pixels to destination cell
-            m = scan2dest
-            m = m.multiply(Transform(1, 0, -x, 0, 1, -y))
-            m = m.inverse()
+            # transformation from destination cell to scan pixels
+            m = Transform(1, 0, x, 0, 1, y).multiply(dest2scan)
             a = m.affine(0, 0, w, h)
             
             p = scan_img.transform((w, h), AFFINE, a, BICUBIC)
@@ -1,14 +1,15 @@
-from numpy import matrix as _matrix, dot as _dot
+from collections import namedtuple
 
-class Point:
-    """ Simplest point.
+from numpy import asarray as _asarray
+
+class Point(namedtuple('Point', ('x', 'y', 'name'), defaults=(None, ))):
+    """ Simplest point, immutable and hashed and compared by value.
     """
-    def __init__(self, x, y, name=None):
-        self.x, self.y, self.name = x, y, name
+    __slots__ = ()
 
     def __str__(self):
         f = self.name and '(%(name)s: %(x).3f, %(y).3f)' or '(%(x).3f, %(y).3f)'
-        return f % self.__dict__
+        return f % self._asdict()
 
 class Vector:
     """ Like a point, but built from difference between two points.
@@ -52,19 +53,30 @@ class Transform:
         self.h = h
         self.i = i
         
-        self.matrix = _matrix([[a, b, c], [d, e, f], [g, h, i]], dtype=float)
+        # computed on first use, transformations don't change after creation
+        self._inverse = None
 
     def __call__(self, pt):
         """
         """
-        pt = _matrix([[pt.x], [pt.y], [1]])
-        pt = _dot(self.matrix, pt)
-        x, y, w = pt[0,0], pt[1,0], pt[2,0]
+        x, y = pt.x, pt.y
+        w = self.g * x + self.h * y + self.i
         
-        return Point(x/w, y/w)
+        return Point((self.a * x + self.b * y + self.c) / w,
+                     (self.d * x + self.e * y + self.f) / w)
     
     def __str__(self):
-        return '[%.3f, %.3f, %.3f], [%.3f, %.3f, %.3f], [%.3f, %.3f, %.3f]' % tuple(self.matrix.flat)
+        return '[%.3f, %.3f, %.3f], [%.3f, %.3f, %.3f], [%.3f, %.3f, %.3f]' \
+             % (self.a, self.b, self.c, self.d, self.e, self.f, self.g, self.h, self.i)
+
+    def apply(self, xs, ys):
+        """ Transform arrays of x and y values at once, returning arrays of x and y.
+        """
+        xs, ys = _asarray(xs, dtype=float), _asarray(ys, dtype=float)
+        ws = self.g * xs + self.h * ys + self.i
+        
+        return (self.a * xs + self.b * ys + self.c) / ws, \
+               (self.d * xs + self.e * ys + self.f) / ws
 
     def affine(self, x, y, w, h):
         """ Return the six terms of a regular affine transformation
@@ -80,14 +92,36 @@ class Transform:
         return t.a, t.b, t.c, t.d, t.e, t.f
     
     def multiply(self, other):
+        """ Return a transformation that applies this one and then other.
         """
-        """
-        return matrix2transform(_dot(other.matrix, self.matrix))
+        a, b, c, d, e, f, g, h, i = self.a, self.b, self.c, self.d, self.e, self.f, self.g, self.h, self.i
+        oa, ob, oc, od, oe, of, og, oh, oi = other.a, other.b, other.c, other.d, other.e, other.f, other.g, other.h, other.i
+        
+        return Transform(oa*a + ob*d + oc*g, oa*b + ob*e + oc*h, oa*c + ob*f + oc*i,
+                         od*a + oe*d + of*g, od*b + oe*e + of*h, od*c + oe*f + of*i,
+                         og*a + oh*d + oi*g, og*b + oh*e + oi*h, og*c + oh*f + oi*i)
 
     def inverse(self):
+        """ Return the inverse transformation, from the adjugate over the determinant.
         """
-        """
-        return matrix2transform(self.matrix.I)
+        if self._inverse is None:
+            a, b, c, d, e, f, g, h, i = self.a, self.b, self.c, self.d, self.e, self.f, self.g, self.h, self.i
+            
+            A, B, C = e*i - f*h, f*g - d*i, d*h - e*g
+            det = float(a*A + b*B + c*C)
+            
+            if det == 0:
+                raise ValueError('Singular transformation has no inverse: %s' % self)
+            
+            inverse = Transform(A / det, (c*h - b*i) / det, (b*f - c*e) / det,
+                                B / det, (a*i - c*g) / det, (c*d - a*f) / det,
+                                C / det, (b*g - a*h) / det, (a*e - b*d) / det)
+            
+            # inverting twice gets this one back
+            inverse._inverse = self
+            self._inverse = inverse
+
+        return self._inverse
 
 def matrix2transform(m):
     """
@@ -238,3 +272,11 @@ if __name__ == '__main__':
 
         assert round(s[i].x, 9) == round(p2s(p[i]).x, 9)
         assert round(s[i].y, 9) == round(p2s(p[i]).y, 9)
+
+    xs, ys = s2p.apply([pt.x for pt in s], [pt.y for pt in s])
+    
+    for i in range(4):
+        assert round(p[i].x, 9) == round(xs[i], 9)
+        assert round(p[i].y, 9) == round(ys[i], 9)
+    
+    assert p2s.inverse() is s2p
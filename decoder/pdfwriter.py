@@ -0,0 +1,194 @@
+""" Minimal PDF writer for pages of raw content stream operators and images.
+
+    Objects are written to the file as soon as they're complete, so a
+    page's images and content don't stay in memory after they're added.
+    Fonts are the standard Type 1 fonts every PDF viewer has, and images
+    are embedded as JPEG or PNG data without decoding them again.
+
+    The page tree and the resources shared by every page are written by
+    close(), along with the cross-reference table.
+
+    >>> import os
+    >>> from io import BytesIO
+    >>> from tempfile import mkstemp
+    >>> from PIL import Image
+    >>> def encode(img, format):
+    ...     buffer = BytesIO()
+    ...     img.save(buffer, format=format)
+    ...     return buffer.getvalue()
+
+    >>> handle, filename = mkstemp(suffix='.pdf')
+    >>> pdf = PDFWriter(filename, 612, 792)
+    >>> font = pdf.font('Helvetica')
+    >>> png = pdf.add_png(encode(Image.new('RGB', (4, 4), (255, 0, 0)), 'PNG'))
+    >>> jpeg = pdf.add_jpeg(encode(Image.new('RGB', (4, 4)), 'JPEG'), 4, 4)
+    >>> font, png, jpeg
+    ('/F1', '/I1', '/I2')
+    >>> pdf.add_png(encode(Image.new('RGBA', (4, 4)), 'PNG'))
+    Traceback (most recent call last):
+      ...
+    ValueError: Unsupported PNG image: depth 8, color type 6, interlace 0
+    >>> pdf.add_page('BT %s 12 Tf 72 72 Td (Hello) Tj ET q 4 0 0 4 0 0 cm %s Do Q' % (font, png))
+    >>> pdf.close()
+
+    >>> data = open(filename, 'rb').read()
+    >>> data[:8], data.split()[-3], data.split()[-1]
+    (b'%PDF-1.4', b'startxref', b'%%EOF')
+    >>> xref = int(data.split()[-2])
+    >>> lines = data[xref:].splitlines()
+    >>> lines[:3]
+    [b'xref', b'0 9', b'0000000000 65535 f ']
+    >>> all([data.startswith(b'%d 0 obj' % number, int(line[:10])) for (number, line) in enumerate(lines[3:11], 1)])
+    True
+    >>> lines[11:13]
+    [b'trailer', b'<< /Size 9 /Root 8 0 R >>']
+    >>> os.close(handle)
+    >>> os.unlink(filename)
+"""
+
+import zlib
+import struct
+
+# object numbers reserved for things that can only be written last
+PAGES, RESOURCES = 1, 2
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# PNG color types PDF can read directly, and their numbers of components
+PNG_COLORS = {0: 1, 2: 3}
+
+COLORSPACES = {1: '/DeviceGray', 3: '/DeviceRGB'}
+
+
+class PDFWriter:
+    """ Pages of width x height points written incrementally to a PDF file.
+    """
+    def __init__(self, filename, width, height):
+        self.file = open(filename, 'wb')
+        self.size = width, height
+
+        self.offsets = {}
+        self.count = RESOURCES
+        self.pages = []
+        self.fonts = {}
+        self.images = []
+
+        # binary comment so tools don't take the file for text
+        self.file.write(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+
+    def write_object(self, body, stream=None, number=None):
+        """ Write an object with an optional stream, and return its number.
+        """
+        if number is None:
+            self.count += 1
+            number = self.count
+
+        self.offsets[number] = self.file.tell()
+
+        if stream is None:
+            self.file.write(b'%d 0 obj\n%s\nendobj\n' % (number, body.encode('ascii')))
+        else:
+            body = '<< %s /Length %d >>' % (body, len(stream))
+            self.file.write(b'%d 0 obj\n%s\nstream\n' % (number, body.encode('ascii')))
+            self.file.write(stream)
+            self.file.write(b'\nendstream\nendobj\n')
+
+        return number
+
+    def font(self, basefont):
+        """ Return the resource name for one of the standard fonts, e.g. "Helvetica-Bold".
+        """
+        if basefont not in self.fonts:
+            number = self.write_object('<< /Type /Font /Subtype /Type1 /BaseFont /%s /Encoding /WinAnsiEncoding >>' % basefont)
+            self.fonts[basefont] = '/F%d' % (len(self.fonts) + 1), number
+
+        return self.fonts[basefont][0]
+
+    def add_image(self, entries, data):
+        number = self.write_object('/Type /XObject /Subtype /Image %s' % entries, data)
+        self.images.append(('/I%d' % (len(self.images) + 1), number))
+
+        return self.images[-1][0]
+
+    def add_jpeg(self, data, width, height, components=3):
+        """ Add a baseline JPEG image, returning its resource name for the Do operator.
+        """
+        entries = '/Width %d /Height %d /ColorSpace %s /BitsPerComponent 8 /Filter /DCTDecode' \
+                % (width, height, COLORSPACES[components])
+
+        return self.add_image(entries, data)
+
+    def add_png(self, data):
+        """ Add an 8-bit, non-interlaced gray or RGB PNG image, returning its resource name.
+
+            PNG pixel data is a zlib stream PDF can use with the right
+            predictor, so it's copied over without decompressing. Raises
+            ValueError for anything else: palette images, images with an
+            alpha channel, interlaced images and bit depths other than 8.
+        """
+        if data[:8] != PNG_SIGNATURE:
+            raise ValueError('Not a PNG image')
+
+        offset, chunks = 8, []
+
+        while offset < len(data):
+            length, kind = struct.unpack('>I4s', data[offset:offset+8])
+            chunk = data[offset+8:offset+8+length]
+            offset += length + 12
+
+            if kind == b'IHDR':
+                width, height, depth, color, _, _, interlace = struct.unpack('>IIBBBBB', chunk)
+
+                if depth != 8 or interlace or color not in PNG_COLORS:
+                    raise ValueError('Unsupported PNG image: depth %d, color type %d, interlace %d' % (depth, color, interlace))
+
+            elif kind == b'IDAT':
+                chunks.append(chunk)
+
+            elif kind == b'IEND':
+                break
+
+        colors = PNG_COLORS[color]
+        entries = '/Width %d /Height %d /ColorSpace %s /BitsPerComponent 8 /Filter /FlateDecode' \
+                  ' /DecodeParms << /Predictor 15 /Colors %d /BitsPerComponent 8 /Columns %d >>' \
+                % (width, height, COLORSPACES[colors], colors, width)
+
+        return self.add_image(entries, b''.join(chunks))
+
+    def add_page(self, content):
+        """ Add a page from a string of content stream operators.
+
+            Text in the content is encoded to match the WinAnsiEncoding of the fonts.
+        """
+        stream = zlib.compress(content.encode('cp1252', 'replace'))
+        contents = self.write_object('/Filter /FlateDecode', stream)
+
+        page = '<< /Type /Page /Parent %d 0 R /MediaBox [0 0 %.2f %.2f] /Resources %d 0 R /Contents %d 0 R >>' \
+             % (PAGES, self.size[0], self.size[1], RESOURCES, contents)
+
+        self.pages.append(self.write_object(page))
+
+    def close(self):
+        """ Write the page tree, shared resources and cross-reference table, and close the file.
+        """
+        fonts = ' '.join(['%s %d 0 R' % font for font in self.fonts.values()])
+        images = ' '.join(['%s %d 0 R' % image for image in self.images])
+
+        self.write_object('<< /ProcSet [/PDF /Text /ImageB /ImageC] /Font << %s >> /XObject << %s >> >>' % (fonts, images), number=RESOURCES)
+
+        kids = ' '.join(['%d 0 R' % number for number in self.pages])
+        self.write_object('<< /Type /Pages /Kids [%s] /Count %d >>' % (kids, len(self.pages)), number=PAGES)
+
+        catalog = self.write_object('<< /Type /Catalog /Pages %d 0 R >>' % PAGES)
+
+        xref = self.file.tell()
+        lines = ['xref', '0 %d' % (self.count + 1), '0000000000 65535 f ']
+        lines += ['%010d 00000 n ' % self.offsets[number] for number in range(1, self.count + 1)]
+        lines += ['trailer', '<< /Size %d /Root %d 0 R >>' % (self.count + 1, catalog), 'startxref', str(xref), '%%EOF', '']
+
+        self.file.write('\n'.join(lines).encode('ascii'))
+        self.file.close()
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
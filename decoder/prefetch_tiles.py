@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+import json
+import sys
+
+from optparse import OptionParser
+
+from sentry_sdk import capture_exception
+
+from compose import prefetch_atlas_tiles, PREFETCH_TIMEOUT
+
+
+if __name__ == '__main__':
+    usage = 'usage: %prog [options] < pages.json'
+    parser = OptionParser(usage)
+
+    parser.set_defaults(
+        paper_size='letter',
+        orientation='landscape',
+        timeout=PREFETCH_TIMEOUT,
+    )
+
+    papers = 'a3 a4 letter'.split()
+    orientations = 'landscape portrait'.split()
+
+    parser.add_option('-s', '--paper-size', dest='paper_size',
+                      help='Choice of papers: %s.' % ', '.join(papers),
+                      choices=papers)
+    parser.add_option('-o', '--orientation', dest='orientation',
+                      help='Choice of orientations: %s.' % ', '.join(orientations),
+                      choices=orientations)
+    parser.add_option('-t', '--timeout', dest='timeout',
+                      help='Seconds to wait for tiles.',
+                      type='float')
+
+    (opts, args) = parser.parse_args()
+    if len(args) != 0:
+        parser.print_help()
+        exit(1)
+
+    try:
+        # pages are a JSON list of objects with provider, zoom and bounds (north, west, south, east)
+        pages = json.load(sys.stdin)
+
+        prefetch_atlas_tiles(pages, opts.paper_size, opts.orientation, opts.timeout)
+    except Exception as e:
+        capture_exception()
+        raise
@@ -5,6 +5,7 @@ import Sentry from "@sentry/node";
 
 import persistTo from "../persisters/index.js";
 import shell from "../shell.js";
+import {logMetrics, metricsPath} from "../tile_metrics.js";
 
 const API_BASE_URL = process.env.API_BASE_URL || "https://fieldpapers.org/",
   ENV = clone(process.env);
@@ -13,6 +14,14 @@ ENV.API_BASE_URL = API_BASE_URL;
 
 export function renderIndex(payload, callback) {
   const page = payload.page,
+    metrics = metricsPath(),
+    // 512px tiles only when a size is given; otherwise @2x tiles are asked
+    // for at 256px, as atlases have always been printed
+    tileSize = page.tile_size || page.atlas.tile_size || ENV.TILE_SIZE || "",
+    // uppercase placeholders; {S} subdomains are spread across by the renderer
+    provider = page.provider.replace(/(\{\w\})/g, function(x) {
+      return x.toUpperCase();
+    }).replace(/,$/, ""),
     cmd = "python3",
     args = [
       "create_index.py",
@@ -22,10 +31,8 @@ export function renderIndex(payload, callback) {
       "-b", page.bbox[3], page.bbox[0], page.bbox[1], page.bbox[2],
       "-e", page.atlas.bbox[3], page.atlas.bbox[0], page.atlas.bbox[1], page.atlas.bbox[2],
       "-z", page.zoom,
-      // strip out subdomain placeholders and uppercase the rest
-      "-p", page.provider.replace(/{s}/i, "a").replace(/(\{\w\})/g, function(x) {
-        return x.toUpperCase();
-      }).replace("@2x", "").replace(/,$/, ""),
+      "-p", tileSize ? provider : provider.replace("@2x", ""),
+      "--tile-size", tileSize,
       "-c", page.atlas.cols,
       "-r", page.atlas.rows,
       "-t", page.atlas.text,
@@ -36,10 +43,14 @@ export function renderIndex(payload, callback) {
 
   return shell(cmd, args, {
     cwd: "/app/decoder",
-    env: ENV,
+    env: Object.assign({}, ENV, {
+      TILE_METRICS_PATH: metrics
+    }),
     killSignal: "SIGKILL",
     timeout: 60e3
   }, persister, function(err, uri) {
+    logMetrics(metrics, `${page.atlas.slug}-index`);
+
     const responsePayload = {
       task: payload.task,
       page: {
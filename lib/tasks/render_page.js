@@ -5,6 +5,7 @@ import Sentry from "@sentry/node";
 
 import persistTo from "../persisters/index.js";
 import shell from "../shell.js";
+import {logMetrics, metricsPath} from "../tile_metrics.js";
 
 const API_BASE_URL = process.env.API_BASE_URL || "https://fieldpapers.org/",
   ENV = clone(process.env);
@@ -13,6 +14,14 @@ ENV.API_BASE_URL = API_BASE_URL;
 
 export function renderPage(payload, callback) {
   const page = payload.page,
+    metrics = metricsPath(),
+    // 512px tiles only when a size is given; otherwise @2x tiles are asked
+    // for at 256px, as atlases have always been printed
+    tileSize = page.tile_size || page.atlas.tile_size || ENV.TILE_SIZE || "",
+    // uppercase placeholders; {S} subdomains are spread across by the renderer
+    provider = page.provider.replace(/(\{\w\})/g, function(x) {
+      return x.toUpperCase();
+    }).replace(/,$/, ""),
     cmd = "python3",
     args = [
       "create_page.py",
@@ -22,10 +31,8 @@ export function renderPage(payload, callback) {
       "-b", page.bbox[3], page.bbox[0], page.bbox[1], page.bbox[2],
       "-n", page.page_number,
       "-z", page.zoom,
-      // strip out subdomain placeholders and uppercase the rest
-      "-p", page.provider.replace(/{s}/i, "a").replace(/(\{\w\})/g, function(x) {
-        return x.toUpperCase();
-      }).replace("@2x", "").replace(/,$/, ""),
+      "-p", tileSize ? provider : provider.replace("@2x", ""),
+      "--tile-size", tileSize,
       "-t", page.atlas.text,
       "-T", page.atlas.title || "",
       page.atlas.slug
@@ -34,10 +41,14 @@ export function renderPage(payload, callback) {
 
   return shell(cmd, args, {
     cwd: "/app/decoder",
-    env: ENV,
+    env: Object.assign({}, ENV, {
+      TILE_METRICS_PATH: metrics
+    }),
     killSignal: "SIGKILL",
     timeout: 60e3
   }, persister, function(err, uri) {
+    logMetrics(metrics, `${page.atlas.slug}-${page.page_number}`);
+
     const responsePayload = {
       task: payload.task,
       page: {
@@ -0,0 +1,29 @@
+import fs from "fs";
+
+import tmp from "tmp";
+
+// where the renderer appends its tile metrics, one JSON line per map; each
+// render gets its own file unless TILE_METRICS_PATH is already set
+export function metricsPath() {
+  return process.env.TILE_METRICS_PATH || tmp.tmpNameSync({
+    prefix: "tile-metrics-",
+    postfix: ".jsonl"
+  });
+}
+
+// log the metrics a render wrote, then remove its file if it was our own
+export function logMetrics(filename, label) {
+  if (filename === process.env.TILE_METRICS_PATH) {
+    return;
+  }
+
+  return fs.readFile(filename, "utf8", function(err, data) {
+    if (!err) {
+      data.split("\n").filter(Boolean).forEach(function(line) {
+        console.log("tile-metrics %s %s", label, line);
+      });
+
+      fs.unlink(filename, err => err && console.warn(err.stack));
+    }
+  });
+}